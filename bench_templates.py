@@ -0,0 +1,52 @@
+from eth_abi.abi import encode
+from eth_account import Account
+from eth_utils import to_hex
+from bot import KiteAI
+import os, sys, timeit
+
+def encode_initializer(bot: KiteAI, address: str):
+    return bytes.fromhex("b63e800d") + encode(
+        [ 'address[]', 'uint256', 'address', 'bytes', 'address', 'address', 'uint256', 'address' ],
+        [ [address], 1, bot.ZERO_CONTRACT_ADDRESS, b"", bot.FALLBACK_HANDLER_ADDRESS, bot.ZERO_CONTRACT_ADDRESS, 0, bot.ZERO_CONTRACT_ADDRESS ]
+    )
+
+def encode_trade(token_in: str, token_out: str):
+    return to_hex(
+        encode(
+            ['uint8', 'uint8', 'uint256', 'uint256', 'address', 'address', 'address'],
+            [32, 96, 0, 0, '0x0000000000000000000000000000000000000002', token_in, token_out]
+        )
+    )
+
+def main():
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+
+    bot = KiteAI()
+    addresses = [Account.from_key(os.urandom(32)).address for _ in range(samples)]
+    tokens = [bot.ZERO_CONTRACT_ADDRESS, bot.USDT_CONTRACT_ADDRESS, bot.WKITE_CONTRACT_ADDRESS, *addresses[:20]]
+
+    for address in addresses:
+        if bot.build_initializer_data(address) != encode_initializer(bot, address):
+            raise SystemExit(f"Initializer Mismatch: {address}")
+
+    for token_in in tokens:
+        for token_out in tokens:
+            for swap_type in ["native to erc20", "erc20 to native"]:
+                if bot.build_instructions_data(addresses[0], swap_type, token_in, token_out)[6][0][3] != encode_trade(token_in, token_out):
+                    raise SystemExit(f"Trade Mismatch: {token_in} -> {token_out}")
+
+    print(f"Identical  : {samples} initializers, {len(tokens) ** 2 * 2} trade payloads")
+
+    address, token_in, token_out = addresses[0], bot.USDT_CONTRACT_ADDRESS, bot.WKITE_CONTRACT_ADDRESS
+    for label, encoder in [
+        ("initializer eth_abi", lambda: encode_initializer(bot, address)),
+        ("initializer template", lambda: bot.build_initializer_data(address)),
+        ("trade eth_abi", lambda: encode_trade(token_in, token_out)),
+        ("instructions template", lambda: bot.build_instructions_data(address, "erc20 to native", token_in, token_out)),
+    ]:
+        elapsed = timeit.timeit(encoder, number=iterations) / iterations
+        print(f"{label:<22}: {elapsed * 1e6:.1f} us")
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,209 @@
-from web3 import Web3
+from web3 import AsyncWeb3
 from web3.exceptions import TransactionNotFound
+from web3.middleware import Web3Middleware
+from web3.datastructures import AttributeDict
 from eth_account import Account
-from eth_abi.abi import encode
-from eth_utils import to_hex
+from eth_abi.abi import encode, decode
+from eth_utils import keccak, to_hex
 from dotenv import load_dotenv
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.backends import default_backend
-from aiohttp import ClientResponseError, ClientSession, ClientTimeout, BasicAuth
-from aiohttp_socks import ProxyConnector
+from aiohttp import ClientConnectionError, ClientResponseError, ClientSession, ClientTimeout, TCPConnector, BasicAuth
+from aiohttp_socks import ProxyConnector, ProxyError
 from fake_useragent import FakeUserAgent
 from http.cookies import SimpleCookie
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
 from datetime import datetime, timezone
+from contextvars import ContextVar
+from contextlib import AsyncExitStack
+from weakref import WeakKeyDictionary
 from colorama import *
-import asyncio, binascii, random, json, re, os, pytz
+import asyncio, binascii, hashlib, random, json, math, time, re, os, pytz
 
 load_dotenv()
 
 wib = pytz.timezone('Asia/Jakarta')
 
+account_context = ContextVar("account_context", default=None)
+
+class RPCHealthMiddleware(Web3Middleware):
+    def __init__(self, w3, bot, key, session):
+        super().__init__(w3)
+        self.bot = bot
+        self.key = key
+        self.session = session
+
+    async def async_wrap_make_request(self, make_request):
+        async def middleware(method, params):
+            lease = self.bot.acquire_connector(self.key[1])
+            try:
+                if self.session.closed:
+                    raise Exception("RPC Session Closed")
+                response = await make_request(method, params)
+            except Exception as e:
+                self.bot.record_rpc_result(self.key, e)
+                raise
+            finally:
+                self.bot.release_connector(lease)
+            self.bot.record_rpc_result(self.key)
+            return response
+
+        return middleware
+
 class KiteAI:
+    NATIVE_CONTRACT_ABI = json.loads('''[
+        {"type":"function","name":"send","stateMutability":"payable","inputs":[{"name":"_destChainId","type":"uint256"},{"name":"_recipient","type":"address"},{"name":"_amount","type":"uint256"}],"outputs":[]},
+        {
+            "type":"function",
+            "name":"initiate",
+            "stateMutability":"payable",
+            "inputs":[
+                {"name":"token","type":"address","internalType":"address"}, 
+                {"name":"amount","type":"uint256","internalType":"uint256"}, 
+                { 
+                    "name":"instructions", 
+                    "type":"tuple", 
+                    "internalType":"struct Instructions",
+                    "components":[
+                        {"name":"sourceId","type":"uint256","internalType":"uint256"}, 
+                        {"name":"receiver","type":"address","internalType":"address"}, 
+                        {"name":"payableReceiver","type":"bool","internalType":"bool"}, 
+                        {"name":"rollbackReceiver","type":"address","internalType":"address"}, 
+                        {"name":"rollbackTeleporterFee","type":"uint256","internalType":"uint256"}, 
+                        {"name":"rollbackGasLimit","type":"uint256","internalType":"uint256"}, 
+                        {
+                            "name":"hops",
+                            "type":"tuple[]",
+                            "internalType":"struct Hop[]",
+                            "components":[
+                                {"name":"action","type":"uint8","internalType":"enum Action"}, 
+                                {"name":"requiredGasLimit","type":"uint256","internalType":"uint256"}, 
+                                {"name":"recipientGasLimit","type":"uint256","internalType":"uint256"}, 
+                                {"name":"trade","type":"bytes","internalType":"bytes"}, 
+                                {
+                                    "name":"bridgePath",
+                                    "type":"tuple",
+                                    "internalType":"struct BridgePath",
+                                    "components":[
+                                        {"name":"bridgeSourceChain","type":"address","internalType":"address"},
+                                        {"name":"sourceBridgeIsNative","type":"bool","internalType":"bool"},
+                                        {"name":"bridgeDestinationChain","type":"address","internalType":"address"},
+                                        {"name":"cellDestinationChain","type":"address","internalType":"address"},
+                                        {"name":"destinationBlockchainID","type":"bytes32","internalType":"bytes32"},
+                                        {"name":"teleporterFee","type":"uint256","internalType":"uint256"},
+                                        {"name":"secondaryTeleporterFee","type":"uint256","internalType":"uint256"}
+                                    ]
+                                }
+                            ]
+                        }
+                    ]
+                }
+            ],
+            "outputs":[]
+        }
+    ]''')
+
+    ERC20_CONTRACT_ABI = json.loads('''[
+        {"type":"function","name":"balanceOf","stateMutability":"view","inputs":[{"name":"address","type":"address"}],"outputs":[{"name":"","type":"uint256"}]},
+        {"type":"function","name":"allowance","stateMutability":"view","inputs":[{"name":"owner","type":"address"},{"name":"spender","type":"address"}],"outputs":[{"name":"","type":"uint256"}]},
+        {"type":"function","name":"approve","stateMutability":"nonpayable","inputs":[{"name":"spender","type":"address"},{"name":"amount","type":"uint256"}],"outputs":[{"name":"","type":"bool"}]},
+        {"type":"function","name":"decimals","stateMutability":"view","inputs":[],"outputs":[{"name":"","type":"uint8"}]},
+        {"type":"function","name":"send","stateMutability":"nonpayable","inputs":[{"name":"_destChainId","type":"uint256"},{"name":"_recipient","type":"address"},{"name":"_amount","type":"uint256"}],"outputs":[]},
+        {"type":"function","name":"proxyCreationCode","stateMutability":"pure","inputs":[],"outputs":[{"name":"","type":"bytes"}]},
+        {
+            "type":"function",
+            "name":"createProxyWithNonce",
+            "stateMutability":"nonpayable",
+            "inputs":[
+                {"internalType":"address","name":"_singleton","type":"address"}, 
+                {"internalType":"bytes","name":"initializer","type":"bytes"}, 
+                {"internalType":"uint256","name":"saltNonce","type":"uint256"}
+            ],
+            "outputs": [
+                {"internalType":"contract GnosisSafeProxy","name":"proxy","type":"address"}
+            ]
+        },
+        {
+            "type":"function",
+            "name":"initiate",
+            "stateMutability":"nonpayable",
+            "inputs":[
+                {"name":"token","type":"address","internalType":"address"}, 
+                {"name":"amount","type":"uint256","internalType":"uint256"}, 
+                { 
+                    "name":"instructions", 
+                    "type":"tuple", 
+                    "internalType":"struct Instructions",
+                    "components":[
+                        {"name":"sourceId","type":"uint256","internalType":"uint256"}, 
+                        {"name":"receiver","type":"address","internalType":"address"}, 
+                        {"name":"payableReceiver","type":"bool","internalType":"bool"}, 
+                        {"name":"rollbackReceiver","type":"address","internalType":"address"}, 
+                        {"name":"rollbackTeleporterFee","type":"uint256","internalType":"uint256"}, 
+                        {"name":"rollbackGasLimit","type":"uint256","internalType":"uint256"}, 
+                        {
+                            "name":"hops",
+                            "type":"tuple[]",
+                            "internalType":"struct Hop[]",
+                            "components":[
+                                {"name":"action","type":"uint8","internalType":"enum Action"}, 
+                                {"name":"requiredGasLimit","type":"uint256","internalType":"uint256"}, 
+                                {"name":"recipientGasLimit","type":"uint256","internalType":"uint256"}, 
+                                {"name":"trade","type":"bytes","internalType":"bytes"}, 
+                                {
+                                    "name":"bridgePath",
+                                    "type":"tuple",
+                                    "internalType":"struct BridgePath",
+                                    "components":[
+                                        {"name":"bridgeSourceChain","type":"address","internalType":"address"},
+                                        {"name":"sourceBridgeIsNative","type":"bool","internalType":"bool"},
+                                        {"name":"bridgeDestinationChain","type":"address","internalType":"address"},
+                                        {"name":"cellDestinationChain","type":"address","internalType":"address"},
+                                        {"name":"destinationBlockchainID","type":"bytes32","internalType":"bytes32"},
+                                        {"name":"teleporterFee","type":"uint256","internalType":"uint256"},
+                                        {"name":"secondaryTeleporterFee","type":"uint256","internalType":"uint256"}
+                                    ]
+                                }
+                            ]
+                        }
+                    ]
+                }
+            ],
+            "outputs":[]
+        }
+    ]''')
+
+    MULTICALL3_CONTRACT_ABI = json.loads('''[
+        {
+            "type":"function",
+            "name":"aggregate3",
+            "stateMutability":"payable",
+            "inputs":[
+                {
+                    "name":"calls",
+                    "type":"tuple[]",
+                    "components":[
+                        {"name":"target","type":"address"},
+                        {"name":"allowFailure","type":"bool"},
+                        {"name":"callData","type":"bytes"}
+                    ]
+                }
+            ],
+            "outputs":[
+                {
+                    "name":"returnData",
+                    "type":"tuple[]",
+                    "components":[
+                        {"name":"success","type":"bool"},
+                        {"name":"returnData","type":"bytes"}
+                    ]
+                }
+            ]
+        },
+        {"type":"function","name":"getEthBalance","stateMutability":"view","inputs":[{"name":"addr","type":"address"}],"outputs":[{"name":"balance","type":"uint256"}]}
+    ]''')
+
     def __init__(self) -> None:
         self.auto_claim_faucet = str(os.getenv("AUTO_CLAIM_FAUCET", "FALSE")).strip().lower() == "true"
         self.auto_deposit_token = str(os.getenv("AUTO_DEPOSIT_TOKEN", "FALSE")).strip().lower() == "true"
@@ -31,15 +216,70 @@ class KiteAI:
         self.auto_create_multisig = str(os.getenv("AUTO_CREATE_MULTISIG", "FALSE")).strip().lower() == "true"
         self.auto_swap_token = str(os.getenv("AUTO_SWAP_TOKEN", "FALSE")).strip().lower() == "true"
         self.auto_bridge_token = str(os.getenv("AUTO_BRIDGE_TOKEN", "FALSE")).strip().lower() == "true"
+        self.account_workers = max(1, int(os.getenv("ACCOUNT_WORKERS", 1)))
+        self.rpc_max_failures = max(1, int(os.getenv("RPC_MAX_FAILURES", 3)))
+        self.balance_scan_chunk = max(1, int(os.getenv("BALANCE_SCAN_CHUNK", 500)))
+        self.receipt_poll_interval = max(0.1, float(os.getenv("RECEIPT_POLL_INTERVAL", 2)))
+        self.receipt_timeout = max(1, int(os.getenv("RECEIPT_TIMEOUT", 300)))
+        self.gas_cache_margin = max(1.0, float(os.getenv("GAS_CACHE_MARGIN", 1.3)))
+        self.stuck_tx_blocks = max(1, int(os.getenv("STUCK_TX_BLOCKS", 20)))
+        self.stuck_tx_max_bumps = max(0, int(os.getenv("STUCK_TX_MAX_BUMPS", 3)))
+        self.fee_bump_percent = max(10, int(os.getenv("FEE_BUMP_PERCENT", 25)))
+        self.multisig_batch_size = max(1, int(os.getenv("MULTISIG_BATCH_SIZE", 1)))
+        self.proxy_probe_concurrency = max(1, int(os.getenv("PROXY_PROBE_CONCURRENCY", 50)))
+        self.proxy_probe_interval = max(10, int(os.getenv("PROXY_PROBE_INTERVAL", 300)))
+        self.proxy_max_failures = max(1, int(os.getenv("PROXY_MAX_FAILURES", 3)))
+        self.proxy_connector_limit = max(1, int(os.getenv("PROXY_CONNECTOR_LIMIT", 256)))
+        self.proxy_connector_idle = max(1, int(os.getenv("PROXY_CONNECTOR_IDLE", 300)))
+        self.proxy_reload_interval = max(1, int(os.getenv("PROXY_RELOAD_INTERVAL", 10)))
+        self.captcha_prefetch = max(0, int(os.getenv("CAPTCHA_PREFETCH", 0)))
+        self.captcha_token_ttl = max(1, int(os.getenv("CAPTCHA_TOKEN_TTL", 110)))
+        self.captcha_max_renewals = max(0, int(os.getenv("CAPTCHA_MAX_RENEWALS", 2)))
+        self.FEE_POLICY = {
+            "percentile": min(100.0, max(0.0, float(os.getenv("FEE_PERCENTILE", 50)))),
+            "blocks": max(1, int(os.getenv("FEE_HISTORY_BLOCKS", 10))),
+            "interval": max(1.0, float(os.getenv("FEE_REFRESH_INTERVAL", 15))),
+            "min_priority_fee": AsyncWeb3.to_wei(os.getenv("FEE_MIN_PRIORITY_GWEI", "0.001"), "gwei"),
+            "max_fee": AsyncWeb3.to_wei(os.getenv("FEE_MAX_GWEI", "10"), "gwei")
+        }
+
+        self.FEATURE_TASKS = {
+            1: { "label": "Faucet", "flag": "auto_claim_faucet", "deps": [], "resources": ["captcha"] },
+            2: { "label": "Deposit", "flag": "auto_deposit_token", "deps": [1], "resources": ["kite_nonce"] },
+            3: { "label": "Withdraw", "flag": "auto_withdraw_token", "deps": [2], "resources": ["aa_wallet"] },
+            4: { "label": "Unstaking", "flag": "auto_unstake_token", "deps": [], "resources": ["aa_wallet"] },
+            5: { "label": "Staking", "flag": "auto_stake_token", "deps": [3, 4], "resources": ["aa_wallet"] },
+            6: { "label": "Reward", "flag": "auto_claim_reward", "deps": [5], "resources": ["aa_wallet"] },
+            7: { "label": "Daily Quiz", "flag": "auto_daily_quiz", "deps": [], "resources": ["api"] },
+            8: { "label": "AI Agent", "flag": "auto_chat_ai_agent", "deps": [], "resources": ["api"] },
+            9: { "label": "Multisig", "flag": "auto_create_multisig", "deps": [1], "resources": ["kite_nonce"] },
+            10: { "label": "Swap", "flag": "auto_swap_token", "deps": [1], "resources": ["kite_nonce"] },
+            11: { "label": "Bridge", "flag": "auto_bridge_token", "deps": [1], "resources": ["kite_nonce", "base_sepolia_nonce"] }
+        }
 
         self.USDT_CONTRACT_ADDRESS = "0x0fF5393387ad2f9f691FD6Fd28e07E3969e27e63"
         self.WKITE_CONTRACT_ADDRESS = "0x3bC8f037691Ce1d28c0bB224BD33563b49F99dE8"
         self.ZERO_CONTRACT_ADDRESS = "0x0000000000000000000000000000000000000000"
+        self.TEMPLATE_ADDRESSES = ["0xabababababababababababababababababababab", "0xcdcdcdcdcdcdcdcdcdcdcdcdcdcdcdcdcdcdcdcd"]
         self.SAFE_PROXY_FACTORY_ADDRESS = "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"
         self.GNOSIS_SAFE_L2_ADDRESS = "0x3E5c63644E683549055b9Be8653de26E0B4CD36E"
         self.FALLBACK_HANDLER_ADDRESS = "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"
+        self.PROXY_CREATION_TOPIC = to_hex(keccak(text="ProxyCreation(address,address)"))
+        self.ABI_TEMPLATES = {
+            "initializer": self.build_abi_template(
+                [ 'address[]', 'uint256', 'address', 'bytes', 'address', 'address', 'uint256', 'address' ],
+                [ [self.TEMPLATE_ADDRESSES[0]], 1, self.ZERO_CONTRACT_ADDRESS, b"", self.FALLBACK_HANDLER_ADDRESS, self.ZERO_CONTRACT_ADDRESS, 0, self.ZERO_CONTRACT_ADDRESS ],
+                self.TEMPLATE_ADDRESSES[:1]
+            ),
+            "trade": self.build_abi_template(
+                ['uint8', 'uint8', 'uint256', 'uint256', 'address', 'address', 'address'],
+                [32, 96, 0, 0, '0x0000000000000000000000000000000000000002', self.TEMPLATE_ADDRESSES[0], self.TEMPLATE_ADDRESSES[1]],
+                self.TEMPLATE_ADDRESSES[:2]
+            )
+        }
         self.BRIDGE_ROUTER_ADDRESS = "0xD1bd49F60A6257dC96B3A040e6a1E17296A51375"
         self.SWAP_ROUTER_ADDRESS = "0x04CfcA82fDf5F4210BC90f06C44EF25Bf743D556"
+        self.MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
         self.DEST_BLOCKCHAIN_ID = "0x6715950e0aad8a92efaade30bd427599e88c459c2d8e29ec350fc4bfb371a114"
 
         self.KITE_AI = {
@@ -66,127 +306,6 @@ class KiteAI:
             "chain_id": 84532
         }
 
-        self.NATIVE_CONTRACT_ABI = json.loads('''[
-            {"type":"function","name":"send","stateMutability":"payable","inputs":[{"name":"_destChainId","type":"uint256"},{"name":"_recipient","type":"address"},{"name":"_amount","type":"uint256"}],"outputs":[]},
-            {
-                "type":"function",
-                "name":"initiate",
-                "stateMutability":"payable",
-                "inputs":[
-                    {"name":"token","type":"address","internalType":"address"}, 
-                    {"name":"amount","type":"uint256","internalType":"uint256"}, 
-                    { 
-                        "name":"instructions", 
-                        "type":"tuple", 
-                        "internalType":"struct Instructions",
-                        "components":[
-                            {"name":"sourceId","type":"uint256","internalType":"uint256"}, 
-                            {"name":"receiver","type":"address","internalType":"address"}, 
-                            {"name":"payableReceiver","type":"bool","internalType":"bool"}, 
-                            {"name":"rollbackReceiver","type":"address","internalType":"address"}, 
-                            {"name":"rollbackTeleporterFee","type":"uint256","internalType":"uint256"}, 
-                            {"name":"rollbackGasLimit","type":"uint256","internalType":"uint256"}, 
-                            {
-                                "name":"hops",
-                                "type":"tuple[]",
-                                "internalType":"struct Hop[]",
-                                "components":[
-                                    {"name":"action","type":"uint8","internalType":"enum Action"}, 
-                                    {"name":"requiredGasLimit","type":"uint256","internalType":"uint256"}, 
-                                    {"name":"recipientGasLimit","type":"uint256","internalType":"uint256"}, 
-                                    {"name":"trade","type":"bytes","internalType":"bytes"}, 
-                                    {
-                                        "name":"bridgePath",
-                                        "type":"tuple",
-                                        "internalType":"struct BridgePath",
-                                        "components":[
-                                            {"name":"bridgeSourceChain","type":"address","internalType":"address"},
-                                            {"name":"sourceBridgeIsNative","type":"bool","internalType":"bool"},
-                                            {"name":"bridgeDestinationChain","type":"address","internalType":"address"},
-                                            {"name":"cellDestinationChain","type":"address","internalType":"address"},
-                                            {"name":"destinationBlockchainID","type":"bytes32","internalType":"bytes32"},
-                                            {"name":"teleporterFee","type":"uint256","internalType":"uint256"},
-                                            {"name":"secondaryTeleporterFee","type":"uint256","internalType":"uint256"}
-                                        ]
-                                    }
-                                ]
-                            }
-                        ]
-                    }
-                ],
-                "outputs":[]
-            }
-        ]''')
-        
-        self.ERC20_CONTRACT_ABI = json.loads('''[
-            {"type":"function","name":"balanceOf","stateMutability":"view","inputs":[{"name":"address","type":"address"}],"outputs":[{"name":"","type":"uint256"}]},
-            {"type":"function","name":"allowance","stateMutability":"view","inputs":[{"name":"owner","type":"address"},{"name":"spender","type":"address"}],"outputs":[{"name":"","type":"uint256"}]},
-            {"type":"function","name":"approve","stateMutability":"nonpayable","inputs":[{"name":"spender","type":"address"},{"name":"amount","type":"uint256"}],"outputs":[{"name":"","type":"bool"}]},
-            {"type":"function","name":"decimals","stateMutability":"view","inputs":[],"outputs":[{"name":"","type":"uint8"}]},
-            {"type":"function","name":"send","stateMutability":"nonpayable","inputs":[{"name":"_destChainId","type":"uint256"},{"name":"_recipient","type":"address"},{"name":"_amount","type":"uint256"}],"outputs":[]},
-            {
-                "type":"function",
-                "name":"createProxyWithNonce",
-                "stateMutability":"nonpayable",
-                "inputs":[
-                    {"internalType":"address","name":"_singleton","type":"address"}, 
-                    {"internalType":"bytes","name":"initializer","type":"bytes"}, 
-                    {"internalType":"uint256","name":"saltNonce","type":"uint256"}
-                ],
-                "outputs": [
-                    {"internalType":"contract GnosisSafeProxy","name":"proxy","type":"address"}
-                ]
-            },
-            {
-                "type":"function",
-                "name":"initiate",
-                "stateMutability":"nonpayable",
-                "inputs":[
-                    {"name":"token","type":"address","internalType":"address"}, 
-                    {"name":"amount","type":"uint256","internalType":"uint256"}, 
-                    { 
-                        "name":"instructions", 
-                        "type":"tuple", 
-                        "internalType":"struct Instructions",
-                        "components":[
-                            {"name":"sourceId","type":"uint256","internalType":"uint256"}, 
-                            {"name":"receiver","type":"address","internalType":"address"}, 
-                            {"name":"payableReceiver","type":"bool","internalType":"bool"}, 
-                            {"name":"rollbackReceiver","type":"address","internalType":"address"}, 
-                            {"name":"rollbackTeleporterFee","type":"uint256","internalType":"uint256"}, 
-                            {"name":"rollbackGasLimit","type":"uint256","internalType":"uint256"}, 
-                            {
-                                "name":"hops",
-                                "type":"tuple[]",
-                                "internalType":"struct Hop[]",
-                                "components":[
-                                    {"name":"action","type":"uint8","internalType":"enum Action"}, 
-                                    {"name":"requiredGasLimit","type":"uint256","internalType":"uint256"}, 
-                                    {"name":"recipientGasLimit","type":"uint256","internalType":"uint256"}, 
-                                    {"name":"trade","type":"bytes","internalType":"bytes"}, 
-                                    {
-                                        "name":"bridgePath",
-                                        "type":"tuple",
-                                        "internalType":"struct BridgePath",
-                                        "components":[
-                                            {"name":"bridgeSourceChain","type":"address","internalType":"address"},
-                                            {"name":"sourceBridgeIsNative","type":"bool","internalType":"bool"},
-                                            {"name":"bridgeDestinationChain","type":"address","internalType":"address"},
-                                            {"name":"cellDestinationChain","type":"address","internalType":"address"},
-                                            {"name":"destinationBlockchainID","type":"bytes32","internalType":"bytes32"},
-                                            {"name":"teleporterFee","type":"uint256","internalType":"uint256"},
-                                            {"name":"secondaryTeleporterFee","type":"uint256","internalType":"uint256"}
-                                        ]
-                                    }
-                                ]
-                            }
-                        ]
-                    }
-                ],
-                "outputs":[]
-            }
-        ]''')
-
         self.BITMIND_SUBNET = {
             "id": "702",
             "name": "Bitmind",
@@ -219,14 +338,72 @@ class KiteAI:
         self.MULTISIG_API = "https://wallet-client.ash.center/v1"
         self.FAUCET_SITE_KEY = "6LeNaK8qAAAAAHLuyTlCrZD_U1UoFLcCTLoa_69T"
         self.TESTNET_SITE_KEY = "6Lc_VwgrAAAAALtx_UtYQnW-cFg8EPDgJ8QVqkaz"
+        self.API_ENDPOINTS = {
+            "user_signin": { "method": "POST", "api": "NEO_API", "path": "/v2/signin", "headers": "TESTNET_HEADERS", "auth": "token", "body": "json", "handler": "handle_signin_response", "scope": "account", "error": "Login Failed" },
+            "user_data": { "method": "GET", "api": "OZONE_API", "path": "/me", "headers": "TESTNET_HEADERS", "auth": "bearer", "scope": "account", "error": "Fetch User Data Failed" },
+            "claim_testnet_faucet": { "method": "POST", "api": "OZONE_API", "path": "/blockchain/faucet-transfer", "headers": "TESTNET_HEADERS", "auth": "bearer", "body": "empty", "label": "Status", "error": "Not Claimed" },
+            "claim_bridge_faucet": { "method": "POST", "api": "FAUCET_API", "path": "/api/sendToken", "headers": "FAUCET_HEADERS", "body": "json", "handler": "handle_faucet_response", "label": "Status", "error": "Not Claimed" },
+            "token_balance": { "method": "GET", "api": "OZONE_API", "path": "/me/balance", "headers": "TESTNET_HEADERS", "auth": "bearer", "label": "Message", "error": "Fetch Token Balance Failed" },
+            "withdraw_token": { "method": "POST", "api": "NEO_API", "path": "/v2/transfer?eoa={address}&amount={amount}&type={token_type}", "headers": "TESTNET_HEADERS", "auth": "bearer", "cookie": True, "body": "empty", "label": "Status", "error": "Withdraw Failed" },
+            "staked_info": { "method": "GET", "api": "OZONE_API", "path": "/subnet/{subnet_id}/staked-info?id={subnet_id}", "headers": "TESTNET_HEADERS", "auth": "bearer", "label": "Message", "error": "Fetch Staked Balance Failed" },
+            "unstake_token": { "method": "POST", "api": "OZONE_API", "path": "/subnet/undelegate", "headers": "TESTNET_HEADERS", "auth": "bearer", "body": "json", "handler": "handle_unstake_response", "label": "Status", "error": "Unstake Failed" },
+            "stake_token": { "method": "POST", "api": "OZONE_API", "path": "/subnet/delegate", "headers": "TESTNET_HEADERS", "auth": "bearer", "body": "json", "label": "Status", "error": "Stake Failed" },
+            "claim_stake_rewards": { "method": "POST", "api": "OZONE_API", "path": "/subnet/claim-rewards", "headers": "TESTNET_HEADERS", "auth": "bearer", "body": "json", "label": "Status", "error": "Claim Failed" },
+            "create_quiz": { "method": "POST", "api": "NEO_API", "path": "/v2/quiz/create", "headers": "TESTNET_HEADERS", "auth": "bearer", "cookie": True, "body": "json", "label": "Message", "error": "Fetch Today Quiz Failed" },
+            "get_quiz": { "method": "GET", "api": "NEO_API", "path": "/v2/quiz/get?id={quiz_id}&eoa={address}", "headers": "TESTNET_HEADERS", "auth": "bearer", "cookie": True, "label": "Message", "error": "Fetch Question & Answer Failed" },
+            "submit_quiz": { "method": "POST", "api": "NEO_API", "path": "/v2/quiz/submit", "headers": "TESTNET_HEADERS", "auth": "bearer", "cookie": True, "body": "json", "label": "Status", "error": "Submit Answer Failed" },
+            "agent_inference": { "method": "POST", "api": "OZONE_API", "path": "/agent/inference", "headers": "TESTNET_HEADERS", "auth": "bearer", "body": "json", "handler": "handle_inference_stream", "label": "Status", "error": "Agents Didn't Respond" },
+            "submit_receipt": { "method": "POST", "api": "NEO_API", "path": "/v2/submit_receipt", "headers": "TESTNET_HEADERS", "auth": "bearer", "cookie": True, "body": "json", "label": "Status", "error": "Submit Receipt Failed" },
+            "get_inference": { "method": "GET", "api": "NEO_API", "path": "/v1/inference?id={inference_id}", "headers": "TESTNET_HEADERS", "auth": "bearer", "cookie": True, "handler": "handle_inference_response", "label": "Message", "error": "Fetch Inference Failed", "retry": {"base_delay": 3} },
+            "owner_safes_wallet": { "method": "GET", "api": "MULTISIG_API", "path": "/chains/2368/owners/{address}/safes", "headers": "MULTISIG_HEADERS", "label": "Message", "error": "Fetch Salt Nonce Failed" },
+            "submit_bridge_transfer": { "method": "POST", "api": "BRIDGE_API", "path": "/bridge-transfer", "headers": "BRIDGE_HEADERS", "body": "json", "label": "Submit", "error": "Failed" }
+        }
+        self.RETRY_POLICY = {
+            "retries": 5,
+            "base_delay": float(os.getenv("RETRY_BASE_DELAY", 1)),
+            "max_delay": float(os.getenv("RETRY_MAX_DELAY", 30)),
+            "max_retry_after": float(os.getenv("RETRY_MAX_RETRY_AFTER", 60)),
+            "fatal_statuses": [400, 401, 404]
+        }
+        self.RATE_LIMITS = {
+            urlparse(self.NEO_API).hostname: float(os.getenv("NEO_RATE_LIMIT", 10)),
+            urlparse(self.OZONE_API).hostname: float(os.getenv("OZONE_RATE_LIMIT", 10)),
+            urlparse(self.MULTISIG_API).hostname: float(os.getenv("MULTISIG_RATE_LIMIT", 5)),
+            urlparse(self.BRIDGE_API).hostname: float(os.getenv("BRIDGE_RATE_LIMIT", 5)),
+            urlparse(self.FAUCET_API).hostname: float(os.getenv("FAUCET_RATE_LIMIT", 5)),
+            "2captcha.com": float(os.getenv("CAPTCHA_RATE_LIMIT", 5))
+        }
         self.CAPTCHA_KEY = None
         self.FAUCET_HEADERS = {}
         self.TESTNET_HEADERS = {}
         self.BRIDGE_HEADERS = {}
         self.MULTISIG_HEADERS = {}
         self.proxies = []
-        self.proxy_index = 0
         self.account_proxies = {}
+        self.proxy_health = {}
+        self.proxy_prober = None
+        self.proxy_watcher = None
+        self.proxy_file_mtime = None
+        self.proxy_connectors = {}
+        self.connector_closers = set()
+        self.sessions = {}
+        self.request_stats = {}
+        self.rate_buckets = {}
+        self.rate_limit_stats = {}
+        self.web3_clients = {}
+        self.web3_handles = WeakKeyDictionary()
+        self.rpc_stats = {}
+        self.token_balances = {}
+        self.nonces = {}
+        self.receipt_watchers = {}
+        self.gas_usage = {}
+        self.sent_transactions = {}
+        self.fee_oracles = {}
+        self.safe_salt_nonces = {}
+        self.captcha_pools = {}
+        self.contracts = {}
+        self.checksum_addresses = {}
+        self.chain_metadata = self.load_chain_metadata()
         self.auth_tokens = {}
         self.header_cookies = {}
         self.access_tokens = {}
@@ -236,9 +413,11 @@ class KiteAI:
         os.system('cls' if os.name == 'nt' else 'clear')
 
     def log(self, message):
+        context = account_context.get()
+        prefix = f"{Fore.WHITE + Style.BRIGHT}{context}{Style.RESET_ALL}{Fore.WHITE + Style.BRIGHT} | {Style.RESET_ALL}" if context else ""
         print(
             f"{Fore.CYAN + Style.BRIGHT}[ {datetime.now().astimezone(wib).strftime('%x %X %Z')} ]{Style.RESET_ALL}"
-            f"{Fore.WHITE + Style.BRIGHT} | {Style.RESET_ALL}{message}",
+            f"{Fore.WHITE + Style.BRIGHT} | {Style.RESET_ALL}{prefix}{message}",
             flush=True
         )
 
@@ -281,57 +460,283 @@ class KiteAI:
         except json.JSONDecodeError:
             return []
     
+    def load_chain_metadata(self):
+        filename = "chain_metadata.json"
+        try:
+            if not os.path.exists(filename):
+                return {}
+
+            with open(filename, 'r') as file:
+                data = json.load(file)
+                if isinstance(data, dict):
+                    return data
+                return {}
+        except (json.JSONDecodeError, OSError):
+            return {}
+        
+    def save_chain_metadata(self):
+        filename = "chain_metadata.json"
+        try:
+            with open(filename, 'w') as file:
+                json.dump(self.chain_metadata, file, indent=4)
+        except OSError as e:
+            self.log(f"{Fore.RED + Style.BRIGHT}Failed To Save {filename}: {e}{Style.RESET_ALL}")
+    
     async def load_proxies(self):
         filename = "proxy.txt"
+        reloaded = self.proxy_file_mtime is not None
         try:
             if not os.path.exists(filename):
                 self.log(f"{Fore.RED + Style.BRIGHT}File {filename} Not Found.{Style.RESET_ALL}")
                 return
+            mtime = os.stat(filename).st_mtime_ns
             with open(filename, 'r') as f:
-                self.proxies = [line.strip() for line in f.read().splitlines() if line.strip()]
+                proxies = [line.strip() for line in f.read().splitlines() if line.strip()]
+
+            if reloaded and (not proxies or os.stat(filename).st_mtime_ns != mtime):
+                self.log(f"{Fore.YELLOW + Style.BRIGHT}Proxies Reload Skipped: {filename} Is Empty Or Still Being Written{Style.RESET_ALL}")
+                return
+
+            added, removed = await self.apply_proxy_list(proxies)
+            self.proxy_file_mtime = mtime
             
             if not self.proxies:
                 self.log(f"{Fore.RED + Style.BRIGHT}No Proxies Found.{Style.RESET_ALL}")
                 return
 
+            if reloaded:
+                self.log(
+                    f"{Fore.GREEN + Style.BRIGHT}Proxies Reload : {Style.RESET_ALL}"
+                    f"{Fore.WHITE + Style.BRIGHT}{len(added)} Added, {len(removed)} Removed{Style.RESET_ALL}"
+                )
+
             self.log(
                 f"{Fore.GREEN + Style.BRIGHT}Proxies Total  : {Style.RESET_ALL}"
                 f"{Fore.WHITE + Style.BRIGHT}{len(self.proxies)}{Style.RESET_ALL}"
             )
         
         except Exception as e:
+            if reloaded:
+                self.log(f"{Fore.YELLOW + Style.BRIGHT}Proxies Reload Skipped: {e}{Style.RESET_ALL}")
+                return
             self.log(f"{Fore.RED + Style.BRIGHT}Failed To Load Proxies: {e}{Style.RESET_ALL}")
             self.proxies = []
 
+    async def apply_proxy_list(self, proxies: list):
+        current = dict.fromkeys(self.check_proxy_schemes(proxy) for proxy in self.proxies)
+        updated = dict.fromkeys(self.check_proxy_schemes(proxy) for proxy in proxies)
+        added = [proxy for proxy in updated if proxy not in current]
+        removed = [proxy for proxy in current if proxy not in updated]
+        self.proxies = proxies
+
+        for proxy in removed:
+            self.proxy_health.pop(proxy, None)
+            if self.get_connector_key(proxy) is not None:
+                await self.retire_proxy_connector(proxy)
+
+        for account in [account for account, proxy in self.account_proxies.items() if proxy in removed]:
+            self.account_proxies.pop(account, None)
+
+        if added and self.proxy_prober is not None:
+            await self.refresh_proxy_health(added)
+
+        return added, removed
+
+    async def run_proxy_watcher(self):
+        while True:
+            await asyncio.sleep(self.proxy_reload_interval)
+            try:
+                mtime = os.stat("proxy.txt").st_mtime_ns
+            except OSError:
+                continue
+
+            if mtime != self.proxy_file_mtime:
+                await self.load_proxies()
+
     def check_proxy_schemes(self, proxies):
         schemes = ["http://", "https://", "socks4://", "socks5://"]
         if any(proxies.startswith(scheme) for scheme in schemes):
             return proxies
         return f"http://{proxies}"
 
+    def get_proxy_health(self, proxy: str):
+        return self.proxy_health.setdefault(proxy, {"latency": None, "failures": 0, "checked": 0.0})
+
+    def record_proxy_result(self, proxy: str, error=None, latency=None):
+        health = self.get_proxy_health(proxy)
+        if error is not None:
+            health["failures"] += 1
+            return
+
+        health["failures"] = 0
+        if latency is not None:
+            health["latency"] = latency if health["latency"] is None else 0.7 * health["latency"] + 0.3 * latency
+
+    def is_proxy_healthy(self, proxy: str):
+        return self.get_proxy_health(proxy)["failures"] < self.proxy_max_failures
+
+    def get_proxy_score(self, proxy: str):
+        health = self.get_proxy_health(proxy)
+        latency = health["latency"] if health["latency"] is not None else 30.0
+        return latency * (1 + health["failures"])
+
+    def get_healthy_proxies(self):
+        proxies = dict.fromkeys(self.check_proxy_schemes(proxy) for proxy in self.proxies)
+        return sorted([proxy for proxy in proxies if self.is_proxy_healthy(proxy)], key=self.get_proxy_score)
+
+    def get_proxy_weight(self, proxy: str):
+        latency = self.get_proxy_health(proxy)["latency"]
+        return 1 / max(latency if latency is not None else 30.0, 0.05)
+
+    def get_rendezvous_score(self, account: str, proxy: str):
+        digest = hashlib.sha256(f"{account}|{proxy}".encode()).digest()
+        point = (int.from_bytes(digest[:8], "big") + 1) / (2 ** 64 + 1)
+        return -self.get_proxy_weight(proxy) / math.log(point)
+
+    def pick_proxy(self, account: str, exclude=None):
+        candidates = [proxy for proxy in self.get_healthy_proxies() if proxy != exclude]
+        if not candidates:
+            candidates = list(dict.fromkeys(self.check_proxy_schemes(proxy) for proxy in self.proxies))
+
+        return max(candidates, key=lambda proxy: self.get_rendezvous_score(account, proxy))
+
     def get_next_proxy_for_account(self, account):
         if account not in self.account_proxies:
             if not self.proxies:
                 return None
-            proxy = self.check_proxy_schemes(self.proxies[self.proxy_index])
-            self.account_proxies[account] = proxy
-            self.proxy_index = (self.proxy_index + 1) % len(self.proxies)
+            self.account_proxies[account] = self.pick_proxy(account)
         return self.account_proxies[account]
 
     def rotate_proxy_for_account(self, account):
         if not self.proxies:
             return None
-        proxy = self.check_proxy_schemes(self.proxies[self.proxy_index])
+        proxy = self.pick_proxy(account, exclude=self.account_proxies.get(account))
         self.account_proxies[account] = proxy
-        self.proxy_index = (self.proxy_index + 1) % len(self.proxies)
         return proxy
+
+    async def probe_proxy(self, proxy: str, semaphore: asyncio.Semaphore):
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await self.probe_connection(proxy)
+                self.record_proxy_result(proxy, latency=time.perf_counter() - started)
+            except Exception:
+                health = self.get_proxy_health(proxy)
+                health["failures"] = max(health["failures"] + 1, self.proxy_max_failures)
+
+            self.get_proxy_health(proxy)["checked"] = time.monotonic()
+
+    async def refresh_proxy_health(self, proxies=None):
+        semaphore = asyncio.Semaphore(self.proxy_probe_concurrency)
+        if proxies is None:
+            proxies = dict.fromkeys(self.check_proxy_schemes(proxy) for proxy in self.proxies)
+        await asyncio.gather(*[self.probe_proxy(proxy, semaphore) for proxy in proxies])
+
+    async def run_proxy_prober(self):
+        while True:
+            await asyncio.sleep(self.proxy_probe_interval)
+            await self.refresh_proxy_health()
+            await self.evict_idle_connectors()
+
+    async def start_proxy_pool(self):
+        if not self.proxies:
+            return
+
+        await self.refresh_proxy_health()
+        self.log(
+            f"{Fore.GREEN + Style.BRIGHT}Proxies Healthy: {Style.RESET_ALL}"
+            f"{Fore.WHITE + Style.BRIGHT}{len(self.get_healthy_proxies())}{Style.RESET_ALL}"
+        )
+
+        if self.proxy_prober is None or self.proxy_prober.done():
+            self.proxy_prober = asyncio.create_task(self.run_proxy_prober())
+        if self.proxy_watcher is None or self.proxy_watcher.done():
+            self.proxy_watcher = asyncio.create_task(self.run_proxy_watcher())
+    
+    def get_connector_key(self, proxy=None):
+        return proxy if proxy and proxy.startswith("socks") else None
+
+    def get_proxy_connector(self, proxy=None):
+        key = self.get_connector_key(proxy)
+        entry = self.proxy_connectors.get(key)
+        if entry is None or entry["connector"].closed:
+            if key is None:
+                connector = TCPConnector(limit=0, keepalive_timeout=60)
+            else:
+                connector = ProxyConnector.from_url(proxy, limit=0, keepalive_timeout=60)
+
+            entry = self.proxy_connectors[key] = {"connector": connector, "used": time.monotonic(), "active": 0, "retired": False}
+            if len(self.proxy_connectors) > self.proxy_connector_limit:
+                candidates = [other for other in self.proxy_connectors if other != key and self.is_connector_evictable(other)]
+                if candidates:
+                    oldest = min(candidates, key=lambda other: self.proxy_connectors[other]["used"])
+                    closer = asyncio.create_task(self.close_proxy_connector(oldest))
+                    self.connector_closers.add(closer)
+                    closer.add_done_callback(self.connector_closers.discard)
+
+        entry["used"] = time.monotonic()
+        return entry["connector"]
+
+    def acquire_connector(self, proxy=None):
+        entry = self.proxy_connectors.get(self.get_connector_key(proxy))
+        if entry is not None:
+            entry["active"] += 1
+            entry["used"] = time.monotonic()
+        return entry
+
+    def release_connector(self, entry):
+        if entry is not None:
+            entry["active"] -= 1
+            entry["used"] = time.monotonic()
+
+    def is_connector_evictable(self, key):
+        return key is not None and self.proxy_connectors[key]["active"] == 0
+
+    async def close_proxy_connector(self, key):
+        entry = self.proxy_connectors.pop(key, None)
+        if entry is None:
+            return
+
+        for client_key in [client_key for client_key, (_, session) in self.web3_clients.items() if session.connector is entry["connector"]]:
+            self.web3_clients.pop(client_key, None)
+
+        for session_key in [session_key for session_key, (session, _, _) in self.sessions.items() if session.connector is entry["connector"]]:
+            session, _, _ = self.sessions.pop(session_key)
+            if not session.closed:
+                await session.close()
+
+        if not entry["connector"].closed:
+            await entry["connector"].close()
+
+    async def retire_proxy_connector(self, key):
+        entry = self.proxy_connectors.get(key)
+        if entry is None:
+            return
+
+        entry["retired"] = True
+        if self.is_connector_evictable(key):
+            await self.close_proxy_connector(key)
+
+    async def evict_idle_connectors(self, idle=None):
+        if idle == 0:
+            for key in list(self.proxy_connectors):
+                await self.close_proxy_connector(key)
+            return
+
+        idle = self.proxy_connector_idle if idle is None else idle
+        now = time.monotonic()
+        for key in [
+            key for key, entry in self.proxy_connectors.items()
+            if (entry["retired"] or now - entry["used"] >= idle) and self.is_connector_evictable(key)
+        ]:
+            await self.close_proxy_connector(key)
     
     def build_proxy_config(self, proxy=None):
         if not proxy:
-            return None, None, None
+            return self.get_proxy_connector(), None, None
 
         if proxy.startswith("socks"):
-            connector = ProxyConnector.from_url(proxy)
+            connector = self.get_proxy_connector(proxy)
             return connector, None, None
 
         elif proxy.startswith("http"):
@@ -340,12 +745,35 @@ class KiteAI:
                 username, password, host_port = match.groups()
                 clean_url = f"http://{host_port}"
                 auth = BasicAuth(username, password)
-                return None, clean_url, auth
+                return self.get_proxy_connector(), clean_url, auth
             else:
-                return None, proxy, None
+                return self.get_proxy_connector(), proxy, None
 
         raise Exception("Unsupported Proxy Type.")
     
+    def get_session(self, address: str, proxy_url=None):
+        key = (address, proxy_url)
+        if key not in self.sessions or self.sessions[key][0].closed:
+            connector, proxy, proxy_auth = self.build_proxy_config(proxy_url)
+            session = ClientSession(connector=connector, connector_owner=False, timeout=ClientTimeout(total=60))
+            self.sessions[key] = (session, proxy, proxy_auth)
+        else:
+            entry = self.proxy_connectors.get(self.get_connector_key(proxy_url))
+            if entry is not None:
+                entry["used"] = time.monotonic()
+
+        return self.sessions[key]
+    
+    async def close_sessions(self, address=None):
+        for key in [key for key in self.sessions if address is None or key[0] == address]:
+            session, _, _ = self.sessions.pop(key)
+            if not session.closed:
+                await session.close()
+
+        if address is None:
+            self.web3_clients.clear()
+            await self.evict_idle_connectors(0)
+    
     def generate_address(self, account: str):
         try:
             account = Account.from_key(account)
@@ -488,39 +916,333 @@ class KiteAI:
             "amount": amount
         }
     
-    async def get_web3_with_check(self, address: str, rpc_url: str, use_proxy: bool, retries=3, timeout=60):
-        request_kwargs = {"timeout": timeout}
+    async def get_web3(self, address: str, rpc_url: str, use_proxy: bool, timeout=60):
+        key = self.get_rpc_key(address, rpc_url, use_proxy)
+        session, proxy, proxy_auth = self.get_session(None, key[1])
+
+        client = self.web3_clients.get(key)
+        if client is not None and client[1] is session:
+            return client[0]
+
+        request_kwargs = {"timeout": ClientTimeout(total=timeout)}
+        if proxy:
+            request_kwargs["proxy"] = proxy
+        if proxy_auth:
+            request_kwargs["proxy_auth"] = proxy_auth
+
+        web3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_url, request_kwargs=request_kwargs))
+        await web3.provider.cache_async_session(session)
+        web3.middleware_onion.add(lambda w3: RPCHealthMiddleware(w3, self, key, session), "rpc_health")
+
+        self.web3_clients[key] = (web3, session)
+        self.web3_handles[web3] = (key, session)
+        return web3
+    
+    async def renew_web3(self, web3, address: str):
+        handle = self.web3_handles.get(web3)
+        if handle is None or not handle[1].closed:
+            return web3
 
-        proxy = self.get_next_proxy_for_account(address) if use_proxy else None
+        key, _ = handle
+        return await self.get_web3(address, key[0], key[1] is not None)
+    
+    def record_rpc_result(self, key: tuple, error=None):
+        stats = self.rpc_stats.setdefault(key, {"requests": 0, "errors": 0, "failures": 0, "evicted": 0})
+        stats["requests"] += 1
+        if error is None:
+            stats["failures"] = 0
+            return
 
-        if use_proxy and proxy:
-            request_kwargs["proxies"] = {"http": proxy, "https": proxy}
+        stats["errors"] += 1
+        stats["failures"] += 1
+        if stats["failures"] >= self.rpc_max_failures and self.web3_clients.pop(key, None) is not None:
+            stats["failures"] = 0
+            stats["evicted"] += 1
+            self.log(
+                f"{Fore.BLUE+Style.BRIGHT}   RPC     : {Style.RESET_ALL}"
+                f"{Fore.YELLOW+Style.BRIGHT}{urlparse(key[0]).hostname} Client Dropped After "
+                f"{self.rpc_max_failures} Failed Calls - {str(error)}{Style.RESET_ALL}"
+            )
+        
+    def get_chain_metadata(self, rpc_url: str):
+        return self.chain_metadata.setdefault(rpc_url, {"chain_id": None, "decimals": {}})
+    
+    def update_chain_metadata(self, rpc_url: str, chain_id=None, decimals=None, proxy_creation_code=None, multicall3=None):
+        metadata = self.get_chain_metadata(rpc_url)
+        changed = False
 
-        for attempt in range(retries):
-            try:
-                web3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs=request_kwargs))
-                web3.eth.get_block_number()
-                return web3
-            except Exception as e:
-                if attempt < retries:
-                    await asyncio.sleep(3)
-                    continue
-                raise Exception(f"Failed to Connect to RPC: {str(e)}")
+        if chain_id is not None and metadata["chain_id"] != chain_id:
+            metadata["chain_id"] = chain_id
+            changed = True
+
+        if proxy_creation_code is not None and metadata.get("proxy_creation_code") != proxy_creation_code:
+            metadata["proxy_creation_code"] = proxy_creation_code
+            changed = True
+
+        if multicall3 is not None and metadata.get("multicall3") != multicall3:
+            metadata["multicall3"] = multicall3
+            changed = True
+
+        for token, value in (decimals or {}).items():
+            if metadata["decimals"].get(token) != value:
+                metadata["decimals"][token] = value
+                changed = True
+
+        if changed:
+            self.save_chain_metadata()
+    
+    def to_checksum(self, address: str):
+        if address not in self.checksum_addresses:
+            self.checksum_addresses[address] = AsyncWeb3.to_checksum_address(address)
+        return self.checksum_addresses[address]
+    
+    def get_contract(self, web3, contract_address: str, abi_name: str):
+        key = (self.to_checksum(contract_address), abi_name)
+        if key not in self.contracts:
+            self.contracts[key] = web3.eth.contract(address=key[0], abi=getattr(self, abi_name))
+        return self.contracts[key]
+    
+    def get_rpc_key(self, address: str, rpc_url: str, use_proxy: bool):
+        if not use_proxy or not self.proxies:
+            return (rpc_url, None)
+        if address is None:
+            return (rpc_url, self.pick_proxy(rpc_url))
+        return (rpc_url, self.get_next_proxy_for_account(address))
+    
+    async def rpc_batch(self, address: str, rpc_url: str, use_proxy: bool, calls: list, timeout=60):
+        return await self.post_rpc_batch(self.get_rpc_key(address, rpc_url, use_proxy), calls, timeout)
+    
+    async def post_rpc_batch(self, key: tuple, calls: list, timeout=60):
+        rpc_url, proxy_url = key
+        session, proxy, proxy_auth = self.get_session(None, proxy_url)
+
+        payload = [{"jsonrpc": "2.0", "id": index, "method": method, "params": params} for index, (method, params) in enumerate(calls)]
+        lease = self.acquire_connector(proxy_url)
+        try:
+            async with session.post(
+                url=rpc_url, json=payload, proxy=proxy, proxy_auth=proxy_auth, timeout=ClientTimeout(total=timeout)
+            ) as response:
+                response.raise_for_status()
+                result = await response.json(content_type=None)
+        except Exception as e:
+            self.record_rpc_result(key, e)
+            raise
+        finally:
+            self.release_connector(lease)
+
+        self.record_rpc_result(key)
+        if not isinstance(result, list):
+            error = result.get("error", {}) if isinstance(result, dict) else {}
+            raise Exception(f"Batch Request Rejected: {error.get('message', result)}")
+
+        responses = {item.get("id"): item for item in result}
+        results = []
+        for index, (method, _) in enumerate(calls):
+            item = responses.get(index)
+            if item is None:
+                raise Exception(f"{method} Missing From Batch Response")
+            if item.get("error"):
+                raise Exception(f"{method} Failed: {item['error'].get('message', item['error'])}")
+            results.append(item.get("result"))
+
+        return results
+    
+    def format_rpc_transaction(self, tx: dict):
+        return {key: hex(value) if isinstance(value, int) else value for key, value in tx.items()}
+    
+    def get_gas_key(self, rpc_url: str, tx: dict):
+        data = tx.get("data", "0x")
+        return (rpc_url, tx["to"].lower(), data[:10], len(data), bool(tx.get("value")))
+    
+    def record_gas_used(self, gas_key: tuple, receipt):
+        if receipt.status == 1:
+            self.gas_usage[gas_key] = max(self.gas_usage.get(gas_key, 0), receipt.gasUsed)
+        else:
+            self.gas_usage.pop(gas_key, None)
+    
+    async def refresh_fee_suggestion(self, address: str, rpc_url: str, use_proxy: bool):
+        policy = self.FEE_POLICY
+        try:
+            history = (await self.rpc_batch(address, rpc_url, use_proxy, [
+                ("eth_feeHistory", [hex(policy["blocks"]), "latest", [policy["percentile"]]])
+            ]))[0]
+            base_fee = int(history["baseFeePerGas"][-1], 16)
+            rewards = sorted(int(reward[0], 16) for reward in history.get("reward") or [] if reward)
+            priority_fee = rewards[len(rewards) // 2] if rewards else 0
+        except Exception:
+            base_fee, priority_fee = 0, 0
+
+        max_priority_fee = min(max(priority_fee, policy["min_priority_fee"]), policy["max_fee"])
+        max_fee = max(min(2 * base_fee + max_priority_fee, policy["max_fee"]), max_priority_fee)
+
+        return max_fee, max_priority_fee
+    
+    async def get_fee_suggestion(self, address: str, rpc_url: str, use_proxy: bool):
+        oracle = self.fee_oracles.setdefault(rpc_url, {"fees": None, "updated": 0.0, "lock": asyncio.Lock()})
+        async with oracle["lock"]:
+            if oracle["fees"] is None or time.monotonic() - oracle["updated"] >= self.FEE_POLICY["interval"]:
+                oracle["fees"] = await self.refresh_fee_suggestion(address, rpc_url, use_proxy)
+                oracle["updated"] = time.monotonic()
+
+        return oracle["fees"]
+    
+    async def prepare_transaction(self, address: str, rpc_url: str, use_proxy: bool, tx: dict, calls=None):
+        chain_id = self.get_chain_metadata(rpc_url)["chain_id"]
+        gas_used = self.gas_usage.get(self.get_gas_key(rpc_url, tx))
+
+        base_calls = {}
+        if gas_used is None:
+            base_calls["gas"] = ("eth_estimateGas", [self.format_rpc_transaction(tx)])
+        base_calls["nonce"] = ("eth_getTransactionCount", [address, "pending"])
+        if chain_id is None:
+            base_calls["chain_id"] = ("eth_chainId", [])
+
+        results, (max_fee, max_priority_fee) = await asyncio.gather(
+            self.rpc_batch(address, rpc_url, use_proxy, [*base_calls.values(), *(calls or [])]),
+            self.get_fee_suggestion(address, rpc_url, use_proxy)
+        )
+        values = {name: int(value, 16) for name, value in zip(base_calls, results)}
+
+        if chain_id is None:
+            chain_id = values["chain_id"]
+            self.update_chain_metadata(rpc_url, chain_id=chain_id)
+
+        gas = int(values["gas"] * 1.2) if gas_used is None else int(gas_used * self.gas_cache_margin)
+        nonce = self.allocate_nonce(rpc_url, address, values["nonce"])
+
+        prepared_tx = {
+            **tx,
+            "gas": gas,
+            "maxFeePerGas": int(max_fee),
+            "maxPriorityFeePerGas": int(max_priority_fee),
+            "nonce": nonce,
+            "chainId": chain_id,
+        }
+
+        return prepared_tx, results[len(base_calls):]
         
+    async def scan_chain_balances(self, chain: dict, addresses: list, use_proxy: bool):
+        web3 = await self.get_web3(None, chain["rpc_url"], use_proxy)
+        multicall_contract = self.get_contract(web3, self.MULTICALL3_ADDRESS, "MULTICALL3_CONTRACT_ABI")
+        known_decimals = self.get_chain_metadata(chain["rpc_url"])["decimals"]
+
+        keys, calls, fallback_calls = [], [], []
+        for owner in [None, *addresses]:
+            for token in chain["tokens"]:
+                token_address = self.to_checksum(token["address"])
+                erc20_contract = self.get_contract(web3, token_address, "ERC20_CONTRACT_ABI")
+                if owner is None:
+                    if token["type"] == "native" or token["address"].lower() in known_decimals:
+                        continue
+                    data = erc20_contract.encode_abi("decimals", [])
+                    calls.append((token_address, True, data))
+                    fallback_calls.append(("eth_call", [{"to": token_address, "data": data}, "latest"]))
+                elif token["type"] == "native":
+                    calls.append((multicall_contract.address, True, multicall_contract.encode_abi("getEthBalance", [owner])))
+                    fallback_calls.append(("eth_getBalance", [owner, "latest"]))
+                else:
+                    data = erc20_contract.encode_abi("balanceOf", [owner])
+                    calls.append((token_address, True, data))
+                    fallback_calls.append(("eth_call", [{"to": token_address, "data": data}, "latest"]))
+
+                keys.append((owner, "native" if token["type"] == "native" else token["address"].lower()))
+
+        chunks = range(0, len(calls), self.balance_scan_chunk)
+        try:
+            results = await self.rpc_batch(None, chain["rpc_url"], use_proxy, [
+                ("eth_call", [{
+                    "to": multicall_contract.address,
+                    "data": multicall_contract.encode_abi("aggregate3", [calls[start:start + self.balance_scan_chunk]])
+                }, "latest"])
+                for start in chunks
+            ])
+            values = [
+                int.from_bytes(data, "big") if success and data else None
+                for result in results
+                for success, data in decode(["(bool,bytes)[]"], bytes.fromhex(result[2:]))[0]
+            ]
+        except Exception:
+            results = await asyncio.gather(*[
+                self.rpc_batch(None, chain["rpc_url"], use_proxy, fallback_calls[start:start + self.balance_scan_chunk])
+                for start in chunks
+            ])
+            values = [int(value, 16) if value and value != "0x" else None for result in results for value in result]
+
+        fetched_decimals = {token: value for (owner, token), value in zip(keys, values) if owner is None and value is not None}
+        self.update_chain_metadata(chain["rpc_url"], decimals=fetched_decimals)
+        decimals = {**known_decimals, **fetched_decimals}
+        for (owner, token), value in zip(keys, values):
+            token_decimals = 18 if token == "native" else decimals.get(token)
+            if owner is None or value is None or token_decimals is None:
+                continue
+            self.token_balances[(chain["rpc_url"], owner, token)] = value / (10 ** token_decimals)
+    
+    async def scan_fleet_balances(self, addresses: list, use_proxy: bool):
+        started = time.monotonic()
+        chains = [self.KITE_AI, self.BASE_SEPOLIA]
+        results = await asyncio.gather(*[self.scan_chain_balances(chain, addresses, use_proxy) for chain in chains], return_exceptions=True)
+
+        for chain, result in zip(chains, results):
+            if isinstance(result, Exception):
+                self.log(
+                    f"{Fore.CYAN+Style.BRIGHT}Balances  :{Style.RESET_ALL}"
+                    f"{Fore.RED+Style.BRIGHT} {chain['name']} Scan Failed {Style.RESET_ALL}"
+                    f"{Fore.MAGENTA+Style.BRIGHT}-{Style.RESET_ALL}"
+                    f"{Fore.YELLOW+Style.BRIGHT} {str(result)} {Style.RESET_ALL}"
+                )
+
+        self.log(
+            f"{Fore.CYAN+Style.BRIGHT}Balances  :{Style.RESET_ALL}"
+            f"{Fore.WHITE+Style.BRIGHT} {len(addresses)} Accounts Scanned In {time.monotonic() - started:.2f}s {Style.RESET_ALL}"
+        )
+    
+    def invalidate_token_balances(self, address: str):
+        for key in [key for key in self.token_balances if key[1] == address]:
+            self.token_balances.pop(key, None)
+    
+    def print_fleet_balances(self, addresses: list):
+        for address in addresses:
+            self.log(
+                f"{Fore.CYAN + Style.BRIGHT}[ Account:{Style.RESET_ALL}"
+                f"{Fore.WHITE + Style.BRIGHT} {self.mask_account(address)} {Style.RESET_ALL}"
+                f"{Fore.CYAN + Style.BRIGHT}]{Style.RESET_ALL}"
+            )
+            for chain in [self.KITE_AI, self.BASE_SEPOLIA]:
+                balances = []
+                for token in chain["tokens"]:
+                    key = (chain["rpc_url"], address, "native" if token["type"] == "native" else token["address"].lower())
+                    balance = self.token_balances.get(key)
+                    balances.append(f"{'N/A' if balance is None else f'{balance:.4f}'} {token['ticker']}")
+
+                self.log(
+                    f"{Fore.BLUE+Style.BRIGHT}   {chain['name']:<12}: {Style.RESET_ALL}"
+                    f"{Fore.WHITE+Style.BRIGHT}{' | '.join(balances)}{Style.RESET_ALL}"
+                )
+    
     async def get_token_balance(self, address: str, rpc_url: str, contract_address: str, token_type: str, use_proxy: bool):
+        key = (rpc_url, address, "native" if token_type == "native" else contract_address.lower())
+        if key in self.token_balances:
+            return self.token_balances.pop(key)
+
         try:
-            web3 = await self.get_web3_with_check(address, rpc_url, use_proxy)
+            web3 = await self.get_web3(address, rpc_url, use_proxy)
 
             if token_type == "native":
-                balance = web3.eth.get_balance(address)
+                balance = await web3.eth.get_balance(address)
                 decimals = 18
             else:
-                token_contract = web3.eth.contract(
-                    address=web3.to_checksum_address(contract_address),
-                    abi=self.ERC20_CONTRACT_ABI
-                )
-                balance = token_contract.functions.balanceOf(address).call()
-                decimals = token_contract.functions.decimals().call()
+                token_contract = self.get_contract(web3, contract_address, "ERC20_CONTRACT_ABI")
+                decimals = self.get_chain_metadata(rpc_url)["decimals"].get(contract_address.lower())
+
+                calls = [("eth_call", [{"to": token_contract.address, "data": token_contract.encode_abi("balanceOf", [address])}, "latest"])]
+                if decimals is None:
+                    calls.append(("eth_call", [{"to": token_contract.address, "data": token_contract.encode_abi("decimals", [])}, "latest"]))
+
+                results = [int(value, 16) for value in await self.rpc_batch(address, rpc_url, use_proxy, calls)]
+                balance = results[0]
+                if decimals is None:
+                    decimals = results[1]
+                    self.update_chain_metadata(rpc_url, decimals={contract_address.lower(): decimals})
 
             token_balance = balance / (10 ** decimals)
 
@@ -532,66 +1254,242 @@ class KiteAI:
             )
             return None
         
+    def allocate_nonce(self, rpc_url: str, address: str, pending_nonce: int):
+        key = (rpc_url, address)
+        nonce = max(self.nonces.get(key, pending_nonce), pending_nonce)
+        self.nonces[key] = nonce + 1
+        return nonce
+    
+    def release_nonce(self, rpc_url: str, address: str, nonce: int):
+        key = (rpc_url, address)
+        if self.nonces.get(key) == nonce + 1:
+            self.nonces[key] = nonce
+        else:
+            self.nonces.pop(key, None)
+    
+    async def resync_nonce(self, web3, address: str):
+        rpc_url = web3.provider.endpoint_uri
+        self.nonces.pop((rpc_url, address), None)
+        return self.allocate_nonce(rpc_url, address, await web3.eth.get_transaction_count(address, "pending"))
+    
+    async def is_transaction_known(self, web3, tx_hash: str):
+        try:
+            await web3.eth.get_transaction(tx_hash)
+            return True
+        except TransactionNotFound:
+            return False
+
     async def send_raw_transaction_with_retries(self, account, web3, tx, retries=5):
+        try:
+            signed_tx = web3.eth.account.sign_transaction(tx, account)
+        except Exception:
+            self.release_nonce(web3.provider.endpoint_uri, tx["from"], tx["nonce"])
+            raise
+
+        tx_hash = web3.to_hex(signed_tx.hash)
         for attempt in range(retries):
             try:
-                signed_tx = web3.eth.account.sign_transaction(tx, account)
-                raw_tx = web3.eth.send_raw_transaction(signed_tx.raw_transaction)
-                tx_hash = web3.to_hex(raw_tx)
-                return tx_hash
-            except TransactionNotFound:
-                pass
+                web3 = await self.renew_web3(web3, tx["from"])
+                if attempt > 0 and await self.is_transaction_known(web3, tx_hash):
+                    break
+                await web3.eth.send_raw_transaction(signed_tx.raw_transaction)
+                break
             except Exception as e:
+                message = str(e).lower()
+                if any(error in message for error in ["already known", "known transaction", "already imported"]):
+                    break
+                if "nonce too low" in message:
+                    try:
+                        if await self.is_transaction_known(web3, tx_hash):
+                            break
+                        tx["nonce"] = await self.resync_nonce(web3, tx["from"])
+                        signed_tx = web3.eth.account.sign_transaction(tx, account)
+                        tx_hash = web3.to_hex(signed_tx.hash)
+                        continue
+                    except Exception as resync_error:
+                        e = resync_error
+
                 self.log(
                     f"{Fore.BLUE + Style.BRIGHT}   Message  :{Style.RESET_ALL}"
                     f"{Fore.YELLOW + Style.BRIGHT} [Attempt {attempt + 1}] Send TX Error: {str(e)} {Style.RESET_ALL}"
                 )
-            await asyncio.sleep(2 ** attempt)
-        raise Exception("Transaction Hash Not Found After Maximum Retries")
+            await asyncio.sleep(min(2 ** attempt, 4))
+        else:
+            self.release_nonce(web3.provider.endpoint_uri, tx["from"], tx["nonce"])
+            self.gas_usage.pop(self.get_gas_key(web3.provider.endpoint_uri, tx), None)
+            raise Exception("Transaction Hash Not Found After Maximum Retries")
+
+        self.invalidate_token_balances(tx["from"])
+        self.sent_transactions[tx_hash] = {"account": account, "tx": dict(tx)}
+        return tx_hash
+
+    def format_receipt(self, receipt: dict):
+        quantities = ["blockNumber", "cumulativeGasUsed", "effectiveGasPrice", "gasUsed", "status", "transactionIndex", "type"]
+        return AttributeDict({
+            key: int(value, 16) if key in quantities and isinstance(value, str) else value
+            for key, value in receipt.items()
+        })
+    
+    def watch_receipt(self, key: tuple, tx_hash: str, sent=None):
+        watcher = self.receipt_watchers.setdefault(key[0], {"pending": {}, "transactions": {}, "block": None, "task": None, "key": key})
+        if watcher["task"] is None or watcher["task"].done():
+            watcher["key"] = key
+        future = watcher["pending"].get(tx_hash)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            watcher["pending"][tx_hash] = future
+
+            if sent is not None:
+                tx = sent["tx"]
+                watcher["transactions"][(tx["from"].lower(), tx["nonce"])] = {
+                    "future": future, "account": sent["account"], "tx": tx, "hashes": [tx_hash],
+                    "block": watcher["block"], "bumps": 0, "cancel_hash": None
+                }
 
-    async def wait_for_receipt_with_retries(self, web3, tx_hash, retries=5):
-        for attempt in range(retries):
+        if watcher["task"] is None or watcher["task"].done():
+            watcher["task"] = asyncio.create_task(self.run_receipt_watcher(watcher))
+
+        return future
+    
+    def bump_fees(self, tx: dict):
+        max_fee = min(tx["maxFeePerGas"] * (100 + self.fee_bump_percent) // 100 + 1, self.FEE_POLICY["max_fee"])
+        max_priority_fee = min(tx["maxPriorityFeePerGas"] * (100 + self.fee_bump_percent) // 100 + 1, max_fee)
+        if max_fee * 10 < tx["maxFeePerGas"] * 11 or max_priority_fee * 10 < tx["maxPriorityFeePerGas"] * 11:
+            return None
+
+        return max_fee, max_priority_fee
+    
+    async def replace_stuck_transaction(self, key: tuple, watcher: dict, state: dict, block_number: int):
+        state["block"] = block_number
+        fees = self.bump_fees(state["tx"])
+        if fees is None:
+            return
+
+        tx = state["tx"]
+        cancel = state["cancel_hash"] is None and state["bumps"] >= self.stuck_tx_max_bumps
+        if cancel:
+            replacement = {
+                "from": tx["from"],
+                "to": tx["from"],
+                "value": 0,
+                "gas": 21000,
+                "nonce": tx["nonce"],
+                "chainId": tx["chainId"],
+            }
+        else:
+            replacement = dict(tx)
+        replacement["maxFeePerGas"], replacement["maxPriorityFeePerGas"] = fees
+
+        context = account_context.set(self.mask_account(tx["from"]) if self.account_workers > 1 else None)
+        try:
+            signed_tx = Account.sign_transaction(replacement, state["account"])
+            tx_hash = to_hex(signed_tx.hash)
+            await self.post_rpc_batch(key, [("eth_sendRawTransaction", [to_hex(signed_tx.raw_transaction)])])
+        except Exception as e:
+            if not any(error in str(e).lower() for error in ["nonce too low", "already known"]):
+                self.log(
+                    f"{Fore.BLUE + Style.BRIGHT}   Message  :{Style.RESET_ALL}"
+                    f"{Fore.YELLOW + Style.BRIGHT} Replace Nonce {tx['nonce']} Failed: {str(e)} {Style.RESET_ALL}"
+                )
+            account_context.reset(context)
+            return
+
+        state["tx"] = replacement
+        state["bumps"] += 1
+        state["hashes"].append(tx_hash)
+        if cancel:
+            state["cancel_hash"] = tx_hash
+        watcher["pending"][tx_hash] = state["future"]
+
+        self.log(
+            f"{Fore.BLUE + Style.BRIGHT}   Message  :{Style.RESET_ALL}"
+            f"{Fore.YELLOW + Style.BRIGHT} {'Cancelled' if cancel else 'Sped Up'} Nonce {tx['nonce']} After {self.stuck_tx_blocks} Blocks {Style.RESET_ALL}"
+        )
+        self.log(
+            f"{Fore.BLUE + Style.BRIGHT}   Tx Hash  :{Style.RESET_ALL}"
+            f"{Fore.WHITE + Style.BRIGHT} {tx_hash} {Style.RESET_ALL}"
+        )
+        account_context.reset(context)
+    
+    async def run_receipt_watcher(self, watcher: dict):
+        account_context.set(None)
+        failures = 0
+        while watcher["pending"]:
+            key = watcher["key"]
+            delay = self.receipt_poll_interval
             try:
-                receipt = await asyncio.to_thread(web3.eth.wait_for_transaction_receipt, tx_hash, timeout=300)
-                return receipt
-            except TransactionNotFound:
-                pass
+                block_number = int((await self.post_rpc_batch(key, [("eth_blockNumber", [])]))[0], 16)
+                if block_number != watcher["block"]:
+                    tx_hashes = list(watcher["pending"])
+                    receipts = await self.post_rpc_batch(key, [("eth_getTransactionReceipt", [tx_hash]) for tx_hash in tx_hashes])
+                    watcher["block"] = block_number
+
+                    cancel_hashes = {state["cancel_hash"] for state in watcher["transactions"].values()}
+                    for tx_hash, receipt in zip(tx_hashes, receipts):
+                        if not receipt:
+                            continue
+                        future = watcher["pending"].pop(tx_hash, None)
+                        if future is None or future.done():
+                            continue
+                        if tx_hash in cancel_hashes:
+                            future.set_exception(Exception(f"Transaction Cancelled After {self.stuck_tx_max_bumps} Fee Bumps"))
+                        else:
+                            future.set_result(self.format_receipt(receipt))
+
+                    for state in list(watcher["transactions"].values()):
+                        if state["future"].done():
+                            continue
+                        if state["block"] is None:
+                            state["block"] = block_number
+                        elif block_number - state["block"] >= self.stuck_tx_blocks:
+                            await self.replace_stuck_transaction(key, watcher, state, block_number)
+                failures = 0
             except Exception as e:
+                failures += 1
+                delay = min(self.receipt_poll_interval * 2 ** failures, 30)
                 self.log(
-                    f"{Fore.BLUE + Style.BRIGHT}   Message  :{Style.RESET_ALL}"
-                    f"{Fore.YELLOW + Style.BRIGHT} [Attempt {attempt + 1}] Wait for Receipt Error: {str(e)} {Style.RESET_ALL}"
+                    f"{Fore.BLUE+Style.BRIGHT}   RPC     : {Style.RESET_ALL}"
+                    f"{Fore.YELLOW+Style.BRIGHT}{urlparse(key[0]).hostname} Receipt Poll Failed, Retry In {delay:.0f}s - {str(e)}{Style.RESET_ALL}"
                 )
-            await asyncio.sleep(2 ** attempt)
-        raise Exception("Transaction Receipt Not Found After Maximum Retries")
+                if key[1] is not None and self.get_healthy_proxies():
+                    watcher["key"] = (key[0], self.pick_proxy(key[0], exclude=key[1]))
+
+            for tx_hash in [tx_hash for tx_hash, future in watcher["pending"].items() if future.done()]:
+                watcher["pending"].pop(tx_hash, None)
+            for nonce_key in [nonce_key for nonce_key, state in watcher["transactions"].items() if state["future"].done()]:
+                watcher["transactions"].pop(nonce_key, None)
+
+            if watcher["pending"]:
+                await asyncio.sleep(delay)
+    
+    async def wait_for_receipt(self, address: str, rpc_url: str, use_proxy: bool, tx_hash: str):
+        sent = self.sent_transactions.pop(tx_hash, None)
+        future = self.watch_receipt(self.get_rpc_key(address, rpc_url, use_proxy), tx_hash, sent)
+        try:
+            receipt = await asyncio.wait_for(asyncio.shield(future), timeout=self.receipt_timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            raise Exception(f"Transaction Receipt Not Found After {self.receipt_timeout} Seconds")
+
+        if sent is not None:
+            self.record_gas_used(self.get_gas_key(rpc_url, sent["tx"]), receipt)
+
+        return receipt["transactionHash"], receipt
     
     async def perform_deposit(self, account: str, address: str, receiver: str, use_proxy: bool):
         try:
-            web3 = await self.get_web3_with_check(address, self.KITE_AI['rpc_url'], use_proxy)
+            web3 = await self.get_web3(address, self.KITE_AI['rpc_url'], use_proxy)
 
             amount_to_wei = web3.to_wei(self.deposit_amount, "ether")
 
-            estimated_gas = web3.eth.estimate_gas({
+            tx, _ = await self.prepare_transaction(address, self.KITE_AI['rpc_url'], use_proxy, {
                 "from": address,
-                "to": web3.to_checksum_address(receiver),
+                "to": self.to_checksum(receiver),
                 "value": amount_to_wei
             })
 
-            max_priority_fee = web3.to_wei(0.001, "gwei")
-            max_fee = max_priority_fee
-
-            tx = {
-                "from": address,
-                "to": web3.to_checksum_address(receiver),
-                "value": amount_to_wei,
-                "gas": int(estimated_gas * 1.2),
-                "maxFeePerGas": int(max_fee),
-                "maxPriorityFeePerGas": int(max_priority_fee),
-                "nonce": web3.eth.get_transaction_count(address, "pending"),
-                "chainId": web3.eth.chain_id,
-            }
-
             tx_hash = await self.send_raw_transaction_with_retries(account, web3, tx)
-            receipt = await self.wait_for_receipt_with_retries(web3, tx_hash)
+            tx_hash, receipt = await self.wait_for_receipt(address, self.KITE_AI['rpc_url'], use_proxy, tx_hash)
             block_number = receipt.blockNumber
 
             return tx_hash, block_number
@@ -602,22 +1500,26 @@ class KiteAI:
             )
             return None, None
         
+    def build_abi_template(self, types: list, values: list, placeholders: list):
+        data = encode(types, values)
+        offsets = [data.index(bytes.fromhex(placeholder[2:]).rjust(32, b"\x00")) + 12 for placeholder in placeholders]
+        return {"data": data, "offsets": offsets}
+    
+    def patch_abi_template(self, name: str, addresses: list):
+        template = self.ABI_TEMPLATES[name]
+        data = bytearray(template["data"])
+        for offset, address in zip(template["offsets"], addresses):
+            value = bytes.fromhex(address[2:] if address[:2] in ("0x", "0X") else address)
+            if len(value) != 20:
+                raise ValueError(f"Invalid Address: {address}")
+            data[offset:offset + 20] = value
+
+        return bytes(data)
+    
     def build_initializer_data(self, address: str):
         try:
             initializer_prefix = bytes.fromhex("b63e800d")
-            initializer_bytes = encode(
-                [ 'address[]', 'uint256', 'address', 'bytes', 'address', 'address', 'uint256', 'address' ],
-                [ 
-                    [address], 
-                    1, 
-                    self.ZERO_CONTRACT_ADDRESS, 
-                    b"", 
-                    self.FALLBACK_HANDLER_ADDRESS, 
-                    self.ZERO_CONTRACT_ADDRESS, 
-                    0, 
-                    self.ZERO_CONTRACT_ADDRESS,
-                ]
-            )
+            initializer_bytes = self.patch_abi_template("initializer", [address])
 
             initializer = initializer_prefix + initializer_bytes
 
@@ -625,35 +1527,125 @@ class KiteAI:
         except Exception as e:
             raise Exception(f"Built Initializer Data Failed: {str(e)}")
     
+    def predict_proxy_address(self, proxy_creation_code: str, initializer: bytes, salt_nonce: int):
+        salt = keccak(keccak(initializer) + encode(["uint256"], [salt_nonce]))
+        deployment_data = bytes.fromhex(proxy_creation_code[2:]) + encode(["address"], [self.GNOSIS_SAFE_L2_ADDRESS])
+        proxy_address = keccak(b"\xff" + bytes.fromhex(self.SAFE_PROXY_FACTORY_ADDRESS[2:]) + salt + keccak(deployment_data))[12:]
+
+        return self.to_checksum(to_hex(proxy_address))
+    
+    async def reserve_salt_nonce(self, address: str, use_proxy: bool):
+        if address not in self.safe_salt_nonces:
+            safes = await self.owner_safes_wallet(address, use_proxy)
+            if not safes: return None
+
+            self.safe_salt_nonces.setdefault(address, len(safes.get("safes", [])))
+
+        salt_nonce = self.safe_salt_nonces[address]
+        self.safe_salt_nonces[address] += 1
+
+        return salt_nonce
+    
+    def release_salt_nonce(self, address: str, salt_nonce: int):
+        if self.safe_salt_nonces.get(address) == salt_nonce + 1:
+            self.safe_salt_nonces[address] = salt_nonce
+    
+    async def get_proxy_creation_code(self, address: str, token_contract, use_proxy: bool):
+        proxy_creation_code = self.get_chain_metadata(self.KITE_AI['rpc_url']).get("proxy_creation_code")
+        if proxy_creation_code is None:
+            (result,) = await self.rpc_batch(address, self.KITE_AI['rpc_url'], use_proxy, [
+                ("eth_call", [{"to": token_contract.address, "data": token_contract.encode_abi("proxyCreationCode", [])}, "latest"])
+            ])
+            proxy_creation_code = to_hex(decode(["bytes"], bytes.fromhex(result[2:]))[0])
+            self.update_chain_metadata(self.KITE_AI['rpc_url'], proxy_creation_code=proxy_creation_code)
+
+        return proxy_creation_code
+    
+    async def has_multicall3(self, address: str, use_proxy: bool):
+        multicall3 = self.get_chain_metadata(self.KITE_AI['rpc_url']).get("multicall3")
+        if multicall3 is None:
+            try:
+                (code,) = await self.rpc_batch(address, self.KITE_AI['rpc_url'], use_proxy, [("eth_getCode", [self.MULTICALL3_ADDRESS, "latest"])])
+            except Exception as e:
+                self.log(
+                    f"{Fore.BLUE+Style.BRIGHT}   Message : {Style.RESET_ALL}"
+                    f"{Fore.RED+Style.BRIGHT}{str(e)}{Style.RESET_ALL}"
+                )
+                return False
+
+            multicall3 = len(code) > 2
+            self.update_chain_metadata(self.KITE_AI['rpc_url'], multicall3=multicall3)
+
+        return multicall3
+    
     async def perform_create_proxy(self, account: str, address: str, salt_nonce: int, use_proxy: bool):
         try:
-            web3 = await self.get_web3_with_check(address, self.KITE_AI['rpc_url'], use_proxy)
+            web3 = await self.get_web3(address, self.KITE_AI['rpc_url'], use_proxy)
 
             initializer = self.build_initializer_data(address)
 
-            token_contract = web3.eth.contract(address=web3.to_checksum_address(self.SAFE_PROXY_FACTORY_ADDRESS), abi=self.ERC20_CONTRACT_ABI)
-            create_proxy_data = token_contract.functions.createProxyWithNonce(self.GNOSIS_SAFE_L2_ADDRESS, initializer, salt_nonce)
-            
-            proxy_address = create_proxy_data.call({"from": address})
+            token_contract = self.get_contract(web3, self.SAFE_PROXY_FACTORY_ADDRESS, "ERC20_CONTRACT_ABI")
+            create_proxy_data = {
+                "from": address,
+                "to": token_contract.address,
+                "data": token_contract.encode_abi("createProxyWithNonce", [self.GNOSIS_SAFE_L2_ADDRESS, initializer, salt_nonce])
+            }
+
+            proxy_creation_code = await self.get_proxy_creation_code(address, token_contract, use_proxy)
+            proxy_address = self.predict_proxy_address(proxy_creation_code, initializer, salt_nonce)
 
-            estimated_gas = create_proxy_data.estimate_gas({"from": address})
-            max_priority_fee = web3.to_wei(0.001, "gwei")
-            max_fee = max_priority_fee
+            create_proxy_tx, _ = await self.prepare_transaction(address, self.KITE_AI['rpc_url'], use_proxy, create_proxy_data)
+
+            tx_hash = await self.send_raw_transaction_with_retries(account, web3, create_proxy_tx)
+            receipt_task = asyncio.create_task(self.wait_for_receipt(address, self.KITE_AI['rpc_url'], use_proxy, tx_hash))
 
-            create_proxy_tx = create_proxy_data.build_transaction({
+            return tx_hash, receipt_task, proxy_address
+        except Exception as e:
+            self.log(
+                f"{Fore.BLUE+Style.BRIGHT}   Message : {Style.RESET_ALL}"
+                f"{Fore.RED+Style.BRIGHT}{str(e)}{Style.RESET_ALL}"
+            )
+            return None, None, None
+    
+    async def perform_create_proxy_batch(self, account: str, address: str, salt_nonces: list, use_proxy: bool):
+        try:
+            web3 = await self.get_web3(address, self.KITE_AI['rpc_url'], use_proxy)
+
+            initializer = self.build_initializer_data(address)
+
+            token_contract = self.get_contract(web3, self.SAFE_PROXY_FACTORY_ADDRESS, "ERC20_CONTRACT_ABI")
+            multicall_contract = self.get_contract(web3, self.MULTICALL3_ADDRESS, "MULTICALL3_CONTRACT_ABI")
+            calls = [
+                (token_contract.address, False, token_contract.encode_abi("createProxyWithNonce", [self.GNOSIS_SAFE_L2_ADDRESS, initializer, salt_nonce]))
+                for salt_nonce in salt_nonces
+            ]
+
+            proxy_creation_code = await self.get_proxy_creation_code(address, token_contract, use_proxy)
+            proxy_addresses = [self.predict_proxy_address(proxy_creation_code, initializer, salt_nonce) for salt_nonce in salt_nonces]
+
+            batch_tx, _ = await self.prepare_transaction(address, self.KITE_AI['rpc_url'], use_proxy, {
                 "from": address,
-                "gas": int(estimated_gas * 1.2),
-                "maxFeePerGas": int(max_fee),
-                "maxPriorityFeePerGas": int(max_priority_fee),
-                "nonce": web3.eth.get_transaction_count(address, "pending"),
-                "chainId": web3.eth.chain_id,
+                "to": multicall_contract.address,
+                "data": multicall_contract.encode_abi("aggregate3", [calls])
             })
 
-            tx_hash = await self.send_raw_transaction_with_retries(account, web3, create_proxy_tx)
-            receipt = await self.wait_for_receipt_with_retries(web3, tx_hash)
+            tx_hash = await self.send_raw_transaction_with_retries(account, web3, batch_tx)
+            tx_hash, receipt = await self.wait_for_receipt(address, self.KITE_AI['rpc_url'], use_proxy, tx_hash)
             block_number = receipt.blockNumber
 
-            return tx_hash, block_number, proxy_address
+            if receipt.status != 1:
+                raise Exception("Batch Transaction Reverted")
+
+            created = {
+                self.to_checksum(to_hex(bytes.fromhex(log["data"][2:])[12:32]))
+                for log in receipt.logs
+                if log["address"].lower() == self.SAFE_PROXY_FACTORY_ADDRESS.lower() and log["topics"] and log["topics"][0].lower() == self.PROXY_CREATION_TOPIC
+            }
+            missing = [proxy_address for proxy_address in proxy_addresses if proxy_address not in created]
+            if missing:
+                raise Exception(f"Proxy Creation Not Found In Logs: {', '.join(missing)}")
+
+            return tx_hash, block_number, proxy_addresses
         except Exception as e:
             self.log(
                 f"{Fore.BLUE+Style.BRIGHT}   Message : {Style.RESET_ALL}"
@@ -663,30 +1655,20 @@ class KiteAI:
     
     async def approving_token(self, account: str, address: str, rpc_url: str, spender_address: str, contract_address: str, amount_to_wei: int, explorer: str, use_proxy: bool):
         try:
-            web3 = await self.get_web3_with_check(address, rpc_url, use_proxy)
+            web3 = await self.get_web3(address, rpc_url, use_proxy)
             
-            spender = web3.to_checksum_address(spender_address)
-            token_contract = web3.eth.contract(address=web3.to_checksum_address(contract_address), abi=self.ERC20_CONTRACT_ABI)
-
-            allowance = token_contract.functions.allowance(address, spender).call()
-            if allowance < amount_to_wei:
-                approve_data = token_contract.functions.approve(spender, amount_to_wei)
-
-                estimated_gas = approve_data.estimate_gas({"from": address})
-                max_priority_fee = web3.to_wei(0.001, "gwei")
-                max_fee = max_priority_fee
-
-                approve_tx = approve_data.build_transaction({
-                    "from": address,
-                    "gas": int(estimated_gas * 1.2),
-                    "maxFeePerGas": int(max_fee),
-                    "maxPriorityFeePerGas": int(max_priority_fee),
-                    "nonce": web3.eth.get_transaction_count(address, "pending"),
-                    "chainId": web3.eth.chain_id,
-                })
+            spender = self.to_checksum(spender_address)
+            token_contract = self.get_contract(web3, contract_address, "ERC20_CONTRACT_ABI")
+
+            approve_tx, (allowance,) = await self.prepare_transaction(address, rpc_url, use_proxy, {
+                "from": address,
+                "to": token_contract.address,
+                "data": token_contract.encode_abi("approve", [spender, amount_to_wei])
+            }, [("eth_call", [{"to": token_contract.address, "data": token_contract.encode_abi("allowance", [address, spender])}, "latest"])])
 
+            if int(allowance, 16) < amount_to_wei:
                 tx_hash = await self.send_raw_transaction_with_retries(account, web3, approve_tx)
-                receipt = await self.wait_for_receipt_with_retries(web3, tx_hash)
+                tx_hash, receipt = await self.wait_for_receipt(address, rpc_url, use_proxy, tx_hash)
                 block_number = receipt.blockNumber
                 
                 self.log(
@@ -706,6 +1688,8 @@ class KiteAI:
                     f"{Fore.WHITE+Style.BRIGHT}{explorer}{tx_hash}{Style.RESET_ALL}"
                 )
                 await self.print_timer("Transactions")
+            else:
+                self.release_nonce(rpc_url, address, approve_tx["nonce"])
             
             return True
         except Exception as e:
@@ -714,12 +1698,7 @@ class KiteAI:
     def build_instructions_data(self, address: str, swap_type: str, token_in: str, token_out: str):
         try:
             payable_receiver = False if swap_type == "native to erc20" else True
-            trade_hex = to_hex(
-                encode(
-                    ['uint8', 'uint8', 'uint256', 'uint256', 'address', 'address', 'address'],
-                    [32, 96, 0, 0, '0x0000000000000000000000000000000000000002', token_in, token_out]
-                )
-            )
+            trade_hex = to_hex(self.patch_abi_template("trade", [token_in, token_out]))
 
             instructions = (
                 1, address, payable_receiver, address, 0, 500000, [
@@ -744,53 +1723,35 @@ class KiteAI:
 
     async def perform_swap(self, account: str, address: str, swap_type: str, token_in: str, token_out: str, amount: float, use_proxy: bool):
         try:
-            web3 = await self.get_web3_with_check(address, self.KITE_AI["rpc_url"], use_proxy)
+            web3 = await self.get_web3(address, self.KITE_AI["rpc_url"], use_proxy)
 
             amount_to_wei = web3.to_wei(amount, "ether")
 
             if swap_type == "native to erc20":
-                token_contract = web3.eth.contract(address=web3.to_checksum_address(self.SWAP_ROUTER_ADDRESS), abi=self.NATIVE_CONTRACT_ABI)
+                token_contract = self.get_contract(web3, self.SWAP_ROUTER_ADDRESS, "NATIVE_CONTRACT_ABI")
 
             elif swap_type == "erc20 to native":
                 await self.approving_token(
                     account, address, self.KITE_AI["rpc_url"], self.SWAP_ROUTER_ADDRESS, token_in, amount_to_wei, self.KITE_AI["explorer"], use_proxy
                 )
-                token_contract = web3.eth.contract(address=web3.to_checksum_address(self.SWAP_ROUTER_ADDRESS), abi=self.ERC20_CONTRACT_ABI)
+                token_contract = self.get_contract(web3, self.SWAP_ROUTER_ADDRESS, "ERC20_CONTRACT_ABI")
 
             instructions = self.build_instructions_data(address, swap_type, token_in, token_out)
 
             token_address = self.ZERO_CONTRACT_ADDRESS if swap_type == "native to erc20" else token_in
 
-            swap_data = token_contract.functions.initiate(token_address, amount_to_wei, instructions)
-
-            max_priority_fee = web3.to_wei(0.001, "gwei")
-            max_fee = max_priority_fee
-
+            swap_data = {
+                "from": address,
+                "to": token_contract.address,
+                "data": token_contract.encode_abi("initiate", [token_address, amount_to_wei, instructions])
+            }
             if swap_type == "native to erc20":
-                estimated_gas = swap_data.estimate_gas({"from": address, "value": amount_to_wei})
-                swap_tx = swap_data.build_transaction({
-                    "from": address,
-                    "value": amount_to_wei,
-                    "gas": int(estimated_gas * 1.2),
-                    "maxFeePerGas": int(max_fee),
-                    "maxPriorityFeePerGas": int(max_priority_fee),
-                    "nonce": web3.eth.get_transaction_count(address, "pending"),
-                    "chainId": web3.eth.chain_id,
-                })
+                swap_data["value"] = amount_to_wei
 
-            elif swap_type == "erc20 to native":
-                estimated_gas = swap_data.estimate_gas({"from": address})
-                swap_tx = swap_data.build_transaction({
-                    "from": address,
-                    "gas": int(estimated_gas * 1.2),
-                    "maxFeePerGas": int(max_fee),
-                    "maxPriorityFeePerGas": int(max_priority_fee),
-                    "nonce": web3.eth.get_transaction_count(address, "pending"),
-                    "chainId": web3.eth.chain_id,
-                })
+            swap_tx, _ = await self.prepare_transaction(address, self.KITE_AI["rpc_url"], use_proxy, swap_data)
 
             tx_hash = await self.send_raw_transaction_with_retries(account, web3, swap_tx)
-            receipt = await self.wait_for_receipt_with_retries(web3, tx_hash)
+            tx_hash, receipt = await self.wait_for_receipt(address, self.KITE_AI["rpc_url"], use_proxy, tx_hash)
             block_number = receipt.blockNumber
 
             return tx_hash, block_number
@@ -803,50 +1764,32 @@ class KiteAI:
         
     async def perform_bridge(self, account: str, address: str, rpc_url: str, dest_chain_id: int, src_address: str, amount: float, token_type: str, explorer: str, use_proxy: bool):
         try:
-            web3 = await self.get_web3_with_check(address, rpc_url, use_proxy)
+            web3 = await self.get_web3(address, rpc_url, use_proxy)
 
             amount_to_wei = web3.to_wei(amount, "ether")
 
             if token_type == "native":
-                token_contract = web3.eth.contract(address=web3.to_checksum_address(src_address), abi=self.NATIVE_CONTRACT_ABI)
+                token_contract = self.get_contract(web3, src_address, "NATIVE_CONTRACT_ABI")
 
             elif token_type == "erc20":
-                token_contract = web3.eth.contract(address=web3.to_checksum_address(src_address), abi=self.ERC20_CONTRACT_ABI)
+                token_contract = self.get_contract(web3, src_address, "ERC20_CONTRACT_ABI")
 
                 if src_address == "0x0fF5393387ad2f9f691FD6Fd28e07E3969e27e63":
                     await self.approving_token(account, address, rpc_url, self.BRIDGE_ROUTER_ADDRESS, src_address, amount_to_wei, explorer, use_proxy)
-                    token_contract = web3.eth.contract(address=web3.to_checksum_address(self.BRIDGE_ROUTER_ADDRESS), abi=self.ERC20_CONTRACT_ABI)
-
-            bridge_data = token_contract.functions.send(dest_chain_id, address, amount_to_wei)
-
-            max_priority_fee = web3.to_wei(0.001, "gwei")
-            max_fee = max_priority_fee
+                    token_contract = self.get_contract(web3, self.BRIDGE_ROUTER_ADDRESS, "ERC20_CONTRACT_ABI")
 
+            bridge_data = {
+                "from": address,
+                "to": token_contract.address,
+                "data": token_contract.encode_abi("send", [dest_chain_id, address, amount_to_wei])
+            }
             if token_type == "native":
-                estimated_gas = bridge_data.estimate_gas({"from": address, "value": amount_to_wei})
-                bridge_tx = bridge_data.build_transaction({
-                    "from": address,
-                    "value": amount_to_wei,
-                    "gas": int(estimated_gas * 1.2),
-                    "maxFeePerGas": int(max_fee),
-                    "maxPriorityFeePerGas": int(max_priority_fee),
-                    "nonce": web3.eth.get_transaction_count(address, "pending"),
-                    "chainId": web3.eth.chain_id,
-                })
+                bridge_data["value"] = amount_to_wei
 
-            elif token_type == "erc20":
-                estimated_gas = bridge_data.estimate_gas({"from": address})
-                bridge_tx = bridge_data.build_transaction({
-                    "from": address,
-                    "gas": int(estimated_gas * 1.2),
-                    "maxFeePerGas": int(max_fee),
-                    "maxPriorityFeePerGas": int(max_priority_fee),
-                    "nonce": web3.eth.get_transaction_count(address, "pending"),
-                    "chainId": web3.eth.chain_id,
-                })
+            bridge_tx, _ = await self.prepare_transaction(address, rpc_url, use_proxy, bridge_data)
 
             tx_hash = await self.send_raw_transaction_with_retries(account, web3, bridge_tx)
-            receipt = await self.wait_for_receipt_with_retries(web3, tx_hash)
+            tx_hash, receipt = await self.wait_for_receipt(address, rpc_url, use_proxy, tx_hash)
             block_number = receipt.blockNumber
 
             return tx_hash, block_number, amount_to_wei
@@ -857,8 +1800,59 @@ class KiteAI:
             )
             return None, None, None
         
+    def print_request_stats(self):
+        if self.request_stats:
+            self.log(f"{Fore.CYAN+Style.BRIGHT}Requests  :{Style.RESET_ALL}")
+            for name, stats in sorted(self.request_stats.items()):
+                average = stats["elapsed"] / stats["calls"]
+                self.log(
+                    f"{Fore.BLUE+Style.BRIGHT}   {name:<22}: {Style.RESET_ALL}"
+                    f"{Fore.WHITE+Style.BRIGHT}{stats['calls']} Calls, {stats['failures']} Failed, "
+                    f"Avg {average:.2f}s, Max {stats['max']:.2f}s{Style.RESET_ALL}"
+                )
+
+        if self.rate_limit_stats:
+            self.log(f"{Fore.CYAN+Style.BRIGHT}Rate Limit:{Style.RESET_ALL}")
+            for host, stats in sorted(self.rate_limit_stats.items()):
+                average = stats["waited"] / stats["requests"]
+                self.log(
+                    f"{Fore.BLUE+Style.BRIGHT}   {host:<32}: {Style.RESET_ALL}"
+                    f"{Fore.WHITE+Style.BRIGHT}{stats['requests']} Requests, {self.RATE_LIMITS[host]:g}/s Budget, "
+                    f"Avg Queue {average:.2f}s, Max Queue {stats['max']:.2f}s{Style.RESET_ALL}"
+                )
+
+        if self.rpc_stats:
+            hosts = {}
+            for (rpc_url, _), stats in self.rpc_stats.items():
+                totals = hosts.setdefault(urlparse(rpc_url).hostname, {"clients": 0, "requests": 0, "errors": 0, "evicted": 0})
+                totals["clients"] += 1
+                for field in ["requests", "errors", "evicted"]:
+                    totals[field] += stats[field]
+
+            self.log(f"{Fore.CYAN+Style.BRIGHT}RPC       :{Style.RESET_ALL}")
+            for host, totals in sorted(hosts.items()):
+                self.log(
+                    f"{Fore.BLUE+Style.BRIGHT}   {host:<32}: {Style.RESET_ALL}"
+                    f"{Fore.WHITE+Style.BRIGHT}{totals['requests']} Calls, {totals['errors']} Failed, "
+                    f"{totals['clients']} Clients, {totals['evicted']} Dropped{Style.RESET_ALL}"
+                )
+
+        self.request_stats.clear()
+        self.rate_limit_stats.clear()
+        self.rpc_stats.clear()
+
     async def print_timer(self, message: str):
-        for remaining in range(random.randint(self.min_delay, self.max_delay), 0, -1):
+        delay = random.randint(self.min_delay, self.max_delay)
+        if account_context.get():
+            self.log(
+                f"{Fore.BLUE + Style.BRIGHT}Wait For{Style.RESET_ALL}"
+                f"{Fore.WHITE + Style.BRIGHT} {delay} {Style.RESET_ALL}"
+                f"{Fore.BLUE + Style.BRIGHT}Seconds For Next {message}...{Style.RESET_ALL}"
+            )
+            await asyncio.sleep(delay)
+            return
+
+        for remaining in range(delay, 0, -1):
             print(
                 f"{Fore.CYAN + Style.BRIGHT}[ {datetime.now().astimezone(wib).strftime('%x %X %Z')} ]{Style.RESET_ALL}"
                 f"{Fore.WHITE + Style.BRIGHT} | {Style.RESET_ALL}"
@@ -1104,9 +2098,10 @@ class KiteAI:
                 print(f"{Fore.WHITE + Style.BRIGHT}10. Random Swap{Style.RESET_ALL}")
                 print(f"{Fore.WHITE + Style.BRIGHT}11. Random Bridge{Style.RESET_ALL}")
                 print(f"{Fore.WHITE + Style.BRIGHT}12. Run All Features{Style.RESET_ALL}")
-                option = int(input(f"{Fore.BLUE + Style.BRIGHT}Choose [1/2/3/4/5/6/7/8/9/10/11/12] -> {Style.RESET_ALL}").strip())
+                print(f"{Fore.WHITE + Style.BRIGHT}13. Scan Token Balances{Style.RESET_ALL}")
+                option = int(input(f"{Fore.BLUE + Style.BRIGHT}Choose [1/2/3/4/5/6/7/8/9/10/11/12/13] -> {Style.RESET_ALL}").strip())
 
-                if option in [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12]:
+                if option in [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13]:
                     option_type = (
                         "Claim Faucets" if option == 1 else 
                         "Deposit KITE Token" if option == 2 else 
@@ -1119,14 +2114,15 @@ class KiteAI:
                         "Create Multisig" if option == 9 else 
                         "Random Swap" if option == 10 else 
                         "Random Bridge" if option == 11 else 
-                        "Run All Features"
+                        "Run All Features" if option == 12 else 
+                        "Scan Token Balances"
                     )
                     print(f"{Fore.GREEN + Style.BRIGHT}{option_type} Selected.{Style.RESET_ALL}")
                     break
                 else:
-                    print(f"{Fore.RED + Style.BRIGHT}Please enter either 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, or 12.{Style.RESET_ALL}")
+                    print(f"{Fore.RED + Style.BRIGHT}Please enter either 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, or 13.{Style.RESET_ALL}")
             except ValueError:
-                print(f"{Fore.RED + Style.BRIGHT}Invalid input. Enter a number (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, or 12).{Style.RESET_ALL}")
+                print(f"{Fore.RED + Style.BRIGHT}Invalid input. Enter a number (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, or 13).{Style.RESET_ALL}")
 
         if option == 2:
             self.print_deposit_question()
@@ -1219,61 +2215,65 @@ class KiteAI:
 
         return option, proxy_choice, rotate_proxy
     
-    async def solve_recaptcha(self, site_key: str, page_url: str, retries=5):
+    async def solve_recaptcha(self, site_key: str, page_url: str, retries=5, quiet=False):
         for attempt in range(retries):
             try:
-                async with ClientSession(timeout=ClientTimeout(total=60)) as session:
-                    
-                    if self.CAPTCHA_KEY is None:
+                session, _, _ = self.get_session(None)
+
+                if self.CAPTCHA_KEY is None:
+                    self.log(
+                        f"{Fore.BLUE + Style.BRIGHT}   Status  : {Style.RESET_ALL}"
+                        f"{Fore.YELLOW + Style.BRIGHT}2Captcha Key Is None{Style.RESET_ALL}"
+                    )
+                    return None
+
+                url = f"http://2captcha.com/in.php?key={self.CAPTCHA_KEY}&method=userrecaptcha&googlekey={site_key}&pageurl={page_url}&json=1"
+                await self.acquire_rate_limit(url)
+                async with session.get(url=url) as response:
+                    response.raise_for_status()
+                    result = await response.json()
+
+                    if result.get("status") != 1:
+                        err_text = result.get("error_text", "Unknown Error")
+                        
                         self.log(
-                            f"{Fore.BLUE + Style.BRIGHT}   Status  : {Style.RESET_ALL}"
-                            f"{Fore.YELLOW + Style.BRIGHT}2Captcha Key Is None{Style.RESET_ALL}"
+                            f"{Fore.BLUE + Style.BRIGHT}   Message : {Style.RESET_ALL}"
+                            f"{Fore.YELLOW + Style.BRIGHT}{err_text}{Style.RESET_ALL}"
                         )
-                        return None
-
-                    url = f"http://2captcha.com/in.php?key={self.CAPTCHA_KEY}&method=userrecaptcha&googlekey={site_key}&pageurl={page_url}&json=1"
-                    async with session.get(url=url) as response:
-                        response.raise_for_status()
-                        result = await response.json()
-
-                        if result.get("status") != 1:
-                            err_text = result.get("error_text", "Unknown Error")
-                            
-                            self.log(
-                                f"{Fore.BLUE + Style.BRIGHT}   Message : {Style.RESET_ALL}"
-                                f"{Fore.YELLOW + Style.BRIGHT}{err_text}{Style.RESET_ALL}"
-                            )
-                            await asyncio.sleep(5)
-                            continue
+                        await asyncio.sleep(5)
+                        continue
 
-                        request_id = result.get("request")
+                    request_id = result.get("request")
+                    if not quiet:
                         self.log(
                             f"{Fore.BLUE + Style.BRIGHT}   Req Id  : {Style.RESET_ALL}"
                             f"{Fore.WHITE + Style.BRIGHT}{request_id}{Style.RESET_ALL}"
                         )
 
-                        for _ in range(30):
-                            res_url = f"http://2captcha.com/res.php?key={self.CAPTCHA_KEY}&action=get&id={request_id}&json=1"
-                            async with session.get(url=res_url) as res_response:
-                                res_response.raise_for_status()
-                                res_result = await res_response.json()
-
-                                if res_result.get("status") == 1:
-                                    recaptcha_token = res_result.get("request")
-                                    return recaptcha_token
-                                elif res_result.get("request") == "CAPCHA_NOT_READY":
+                    for _ in range(30):
+                        res_url = f"http://2captcha.com/res.php?key={self.CAPTCHA_KEY}&action=get&id={request_id}&json=1"
+                        await self.acquire_rate_limit(res_url)
+                        async with session.get(url=res_url) as res_response:
+                            res_response.raise_for_status()
+                            res_result = await res_response.json()
+
+                            if res_result.get("status") == 1:
+                                recaptcha_token = res_result.get("request")
+                                return recaptcha_token
+                            elif res_result.get("request") == "CAPCHA_NOT_READY":
+                                if not quiet:
                                     self.log(
                                         f"{Fore.BLUE + Style.BRIGHT}   Message : {Style.RESET_ALL}"
                                         f"{Fore.YELLOW + Style.BRIGHT}Recaptcha Not Ready{Style.RESET_ALL}"
                                     )
-                                    await asyncio.sleep(5)
-                                    continue
-                                else:
-                                    break
+                                await asyncio.sleep(5)
+                                continue
+                            else:
+                                break
 
             except (Exception, ClientResponseError) as e:
                 if attempt < retries - 1:
-                    await asyncio.sleep(5)
+                    await asyncio.sleep(self.retry_delay(self.RETRY_POLICY, attempt, e))
                     continue
                 self.log(
                     f"{Fore.BLUE + Style.BRIGHT}   Status  : {Style.RESET_ALL}"
@@ -1283,13 +2283,126 @@ class KiteAI:
                 )
                 return None
     
-    async def check_connection(self, proxy_url=None):
+    def start_captcha_prefetch(self, site_key: str, page_url: str, accounts: int, need: int):
+        if self.CAPTCHA_KEY is None or self.captcha_prefetch <= 0:
+            return
+
+        pool = self.captcha_pools.setdefault((site_key, page_url), {"jobs": [], "renewals": {}, "deferred": {}, "claims": {}, "demand": 0, "need": need})
+        pool["demand"] = accounts * need
+        self.fill_captcha_pool(site_key, page_url)
+
+    def count_captcha_jobs(self, pool: dict):
+        return len(pool["jobs"]) - len(pool["renewals"])
+
+    def fill_captcha_pool(self, site_key: str, page_url: str):
+        pool = self.captcha_pools.get((site_key, page_url))
+        if pool is None:
+            return
+
+        while self.count_captcha_jobs(pool) < min(self.captcha_prefetch, pool["demand"]):
+            pool["jobs"].append(asyncio.create_task(self.prefetch_recaptcha(site_key, page_url)))
+
+    def trim_captcha_pool(self, pool: dict):
+        while self.count_captcha_jobs(pool) > pool["demand"] and not pool["jobs"][-1].done():
+            job = pool["jobs"].pop()
+            pool["renewals"].pop(job, None)
+            pool["deferred"].pop(job, None)
+            for renewed in [renewed for renewed, renewal in pool["renewals"].items() if renewal is job]:
+                pool["renewals"].pop(renewed)
+            job.cancel()
+
+    async def prefetch_recaptcha(self, site_key: str, page_url: str, renews=None, renewals=0):
+        account_context.set("Captcha")
+        started = time.monotonic()
+        recaptcha_token = await self.solve_recaptcha(site_key, page_url, quiet=True)
+        solved = time.monotonic()
+
+        pool = self.captcha_pools.get((site_key, page_url))
+        if recaptcha_token and pool is not None and pool["renewals"].get(renews) is asyncio.current_task():
+            pool["renewals"].pop(renews)
+            pool["jobs"].remove(renews)
+
+        if recaptcha_token:
+            renew_in = max(self.captcha_token_ttl - 2 * (solved - started), 0)
+            asyncio.get_running_loop().call_later(renew_in, self.renew_captcha_job, site_key, page_url, asyncio.current_task(), renewals + 1)
+        return recaptcha_token, solved
+
+    def renew_captcha_job(self, site_key: str, page_url: str, job, renewals: int):
+        pool = self.captcha_pools.get((site_key, page_url))
+        if pool is None or job not in pool["jobs"] or job in pool["renewals"]:
+            return
+        if renewals > self.captcha_max_renewals:
+            return
+
+        live = [live for live in pool["jobs"] if live not in pool["renewals"]]
+        if live.index(job) >= sum(pool["claims"].values()):
+            pool["deferred"][job] = renewals
+            return
+
+        renewal = pool["renewals"][job] = asyncio.create_task(self.prefetch_recaptcha(site_key, page_url, job, renewals))
+        pool["jobs"].insert(pool["jobs"].index(job) + 1, renewal)
+
+    def open_captcha_claims(self, address: str):
+        for (site_key, page_url), pool in self.captcha_pools.items():
+            pool["claims"][address] = pool["need"]
+            deferred, pool["deferred"] = pool["deferred"], {}
+            for job, renewals in deferred.items():
+                self.renew_captcha_job(site_key, page_url, job, renewals)
+
+    def claim_captcha(self, pool: dict, address: str):
+        pool["demand"] = max(pool["demand"] - 1, 0)
+        if pool["claims"].get(address, 0) > 0:
+            pool["claims"][address] -= 1
+
+    def skip_captcha_claim(self, site_key: str, page_url: str, address: str):
+        pool = self.captcha_pools.get((site_key, page_url))
+        if pool is not None:
+            self.claim_captcha(pool, address)
+            self.trim_captcha_pool(pool)
+
+    def close_captcha_claims(self, address: str):
+        for pool in self.captcha_pools.values():
+            pool["demand"] = max(pool["demand"] - pool["claims"].pop(address, pool["need"]), 0)
+            self.trim_captcha_pool(pool)
+
+    async def get_recaptcha_token(self, site_key: str, page_url: str, address: str):
+        pool = self.captcha_pools.get((site_key, page_url))
+        if pool is not None:
+            self.claim_captcha(pool, address)
+            while pool["jobs"]:
+                job = pool["jobs"].pop(0)
+                pool["renewals"].pop(job, None)
+                pool["deferred"].pop(job, None)
+                self.fill_captcha_pool(site_key, page_url)
+
+                recaptcha_token, solved = await job
+                if recaptcha_token and time.monotonic() - solved < self.captcha_token_ttl:
+                    return recaptcha_token
+
+        return await self.solve_recaptcha(site_key, page_url)
+
+    async def stop_captcha_prefetch(self):
+        for pool in self.captcha_pools.values():
+            for job in pool["jobs"]:
+                job.cancel()
+            await asyncio.gather(*pool["jobs"], return_exceptions=True)
+
+        self.captcha_pools.clear()
+    
+    async def probe_connection(self, proxy_url=None):
         connector, proxy, proxy_auth = self.build_proxy_config(proxy_url)
+        lease = self.acquire_connector(proxy_url)
         try:
-            async with ClientSession(connector=connector, timeout=ClientTimeout(total=30)) as session:
+            async with ClientSession(connector=connector, connector_owner=False, timeout=ClientTimeout(total=30)) as session:
                 async with session.get(url="https://api.ipify.org?format=json", proxy=proxy, proxy_auth=proxy_auth) as response:
                     response.raise_for_status()
-                    return True
+        finally:
+            self.release_connector(lease)
+    
+    async def check_connection(self, proxy_url=None):
+        try:
+            await self.probe_connection(proxy_url)
+            return True
         except (Exception, ClientResponseError) as e:
             self.log(
                 f"{Fore.CYAN+Style.BRIGHT}Status    :{Style.RESET_ALL}"
@@ -1300,614 +2413,332 @@ class KiteAI:
         
         return None
     
-    async def user_signin(self, address: str, use_proxy: bool, retries=5):
-        url = f"{self.NEO_API}/v2/signin"
-        data = json.dumps({"eoa":address})
-        headers = {
-            **self.TESTNET_HEADERS[address],
-            "Authorization": self.auth_tokens[address],
-            "Content-Length": str(len(data)),
-            "Content-Type": "application/json"
-        }
-        await asyncio.sleep(3)
-        for attempt in range(retries):
-            proxy_url = self.get_next_proxy_for_account(address) if use_proxy else None
-            connector, proxy, proxy_auth = self.build_proxy_config(proxy_url)
-            try:
-                async with ClientSession(connector=connector, timeout=ClientTimeout(total=60)) as session:
-                    async with session.post(url=url, headers=headers, data=data, proxy=proxy, proxy_auth=proxy_auth) as response:
-                        response.raise_for_status()
-                        result = await response.json()
-
-                        raw_cookies = response.headers.getall('Set-Cookie', [])
-                        if raw_cookies:
-                            cookie = SimpleCookie()
-                            cookie.load("\n".join(raw_cookies))
-                            cookie_string = "; ".join([f"{key}={morsel.value}" for key, morsel in cookie.items()])
-                            self.header_cookies[address] = cookie_string
-
-                            return result
-            except (Exception, ClientResponseError) as e:
-                if attempt < retries - 1:
-                    await asyncio.sleep(5)
-                    continue
-                self.log(
-                    f"{Fore.CYAN+Style.BRIGHT}Status    :{Style.RESET_ALL}"
-                    f"{Fore.RED+Style.BRIGHT} Login Failed {Style.RESET_ALL}"
-                    f"{Fore.MAGENTA+Style.BRIGHT}-{Style.RESET_ALL}"
-                    f"{Fore.YELLOW+Style.BRIGHT} {str(e)} {Style.RESET_ALL}"
-                )
-        
-        return None
-    
-    async def user_data(self, address: str, use_proxy: bool, retries=5):
-        url = f"{self.OZONE_API}/me"
-        headers = {
-            **self.TESTNET_HEADERS[address],
-            "Authorization": f"Bearer {self.access_tokens[address]}"
-        }
-        await asyncio.sleep(3)
-        for attempt in range(retries):
-            proxy_url = self.get_next_proxy_for_account(address) if use_proxy else None
-            connector, proxy, proxy_auth = self.build_proxy_config(proxy_url)
-            try:
-                async with ClientSession(connector=connector, timeout=ClientTimeout(total=60)) as session:
-                    async with session.get(url=url, headers=headers, proxy=proxy, proxy_auth=proxy_auth) as response:
-                        response.raise_for_status()
-                        return await response.json()
-            except (Exception, ClientResponseError) as e:
-                if attempt < retries - 1:
-                    await asyncio.sleep(5)
-                    continue
-                self.log(
-                    f"{Fore.CYAN+Style.BRIGHT}Status    :{Style.RESET_ALL}"
-                    f"{Fore.RED+Style.BRIGHT} Fetch User Data Failed {Style.RESET_ALL}"
-                    f"{Fore.MAGENTA+Style.BRIGHT}-{Style.RESET_ALL}"
-                    f"{Fore.YELLOW+Style.BRIGHT} {str(e)} {Style.RESET_ALL}"
-                )
+    def build_endpoint_headers(self, endpoint: dict, address: str, data=None, headers=None):
+        request_headers = {**getattr(self, endpoint["headers"])[address]}
 
-        return None
-    
-    async def claim_testnet_faucet(self, address: str, recaptcha_token: str, use_proxy: bool, retries=5):
-        url = f"{self.OZONE_API}/blockchain/faucet-transfer"
-        headers = {
-            **self.TESTNET_HEADERS[address],
-            "Authorization": f"Bearer {self.access_tokens[address]}",
-            "Content-Length":"2",
-            "Content-Type": "application/json",
-            "x-recaptcha-token": recaptcha_token
-        }
-        await asyncio.sleep(3)
-        for attempt in range(retries):
-            proxy_url = self.get_next_proxy_for_account(address) if use_proxy else None
-            connector, proxy, proxy_auth = self.build_proxy_config(proxy_url)
-            try:
-                async with ClientSession(connector=connector, timeout=ClientTimeout(total=60)) as session:
-                    async with session.post(url=url, headers=headers, json={}, proxy=proxy, proxy_auth=proxy_auth) as response:
-                        response.raise_for_status()
-                        return await response.json()
-            except (Exception, ClientResponseError) as e:
-                if attempt < retries - 1:
-                    await asyncio.sleep(5)
-                    continue
-                self.log(
-                    f"{Fore.BLUE + Style.BRIGHT}   Status  : {Style.RESET_ALL}"
-                    f"{Fore.RED+Style.BRIGHT}Not Claimed{Style.RESET_ALL}"
-                    f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
-                    f"{Fore.YELLOW+Style.BRIGHT}{str(e)}{Style.RESET_ALL}"
-                )
+        if endpoint.get("auth") == "token":
+            request_headers["Authorization"] = self.auth_tokens[address]
+        elif endpoint.get("auth") == "bearer":
+            request_headers["Authorization"] = f"Bearer {self.access_tokens[address]}"
 
-        return None
-    
-    async def claim_bridge_faucet(self, address: str, payload: dict, use_proxy: bool, retries=5):
-        url = f"{self.FAUCET_API}/api/sendToken"
-        data = json.dumps(payload)
-        headers = {
-            **self.FAUCET_HEADERS[address],
-            "Content-Length": str(len(data)),
-            "Content-Type": "application/json"
-        }
-        await asyncio.sleep(3)
-        for attempt in range(retries):
-            proxy_url = self.get_next_proxy_for_account(address) if use_proxy else None
-            connector, proxy, proxy_auth = self.build_proxy_config(proxy_url)
-            try:
-                async with ClientSession(connector=connector, timeout=ClientTimeout(total=60)) as session:
-                    async with session.post(url=url, headers=headers, data=data, proxy=proxy, proxy_auth=proxy_auth) as response:
-                        if response.status == 429:
-                            result = await response.json()
-                            err_msg = result.get("message", "Unknown Error")
-                            self.log(
-                                f"{Fore.BLUE + Style.BRIGHT}   Status  : {Style.RESET_ALL}"
-                                f"{Fore.RED+Style.BRIGHT}Not Time to Claim{Style.RESET_ALL}"
-                                f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
-                                f"{Fore.YELLOW+Style.BRIGHT}{err_msg}{Style.RESET_ALL}"
-                            )
-                            return None
-
-                        response.raise_for_status()
-                        return await response.json()
-            except (Exception, ClientResponseError) as e:
-                if attempt < retries - 1:
-                    await asyncio.sleep(5)
-                    continue
-                self.log(
-                    f"{Fore.BLUE + Style.BRIGHT}   Status  : {Style.RESET_ALL}"
-                    f"{Fore.RED+Style.BRIGHT}Not Claimed{Style.RESET_ALL}"
-                    f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
-                    f"{Fore.YELLOW+Style.BRIGHT}{str(e)}{Style.RESET_ALL}"
-                )
+        if endpoint.get("cookie"):
+            request_headers["Cookie"] = self.header_cookies[address]
 
-        return None
-            
-    async def token_balance(self, address: str, use_proxy: bool, retries=5):
-        url = f"{self.OZONE_API}/me/balance"
-        headers = {
-            **self.TESTNET_HEADERS[address],
-            "Authorization": f"Bearer {self.access_tokens[address]}"
-        }
-        await asyncio.sleep(3)
-        for attempt in range(retries):
-            proxy_url = self.get_next_proxy_for_account(address) if use_proxy else None
-            connector, proxy, proxy_auth = self.build_proxy_config(proxy_url)
-            try:
-                async with ClientSession(connector=connector, timeout=ClientTimeout(total=60)) as session:
-                    async with session.get(url=url, headers=headers, proxy=proxy, proxy_auth=proxy_auth) as response:
-                        response.raise_for_status()
-                        return await response.json()
-            except (Exception, ClientResponseError) as e:
-                if attempt < retries - 1:
-                    await asyncio.sleep(5)
-                    continue
-                self.log(
-                    f"{Fore.BLUE + Style.BRIGHT}   Message : {Style.RESET_ALL}"
-                    f"{Fore.RED+Style.BRIGHT}Fetch Token Balance Failed{Style.RESET_ALL}"
-                    f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
-                    f"{Fore.YELLOW+Style.BRIGHT}{str(e)}{Style.RESET_ALL}"
-                )
+        if data is not None:
+            request_headers["Content-Length"] = str(len(data))
+            request_headers["Content-Type"] = "application/json"
 
-        return None
-    
-    async def withdraw_token(self, address: str, amount: int, token_type: str, use_proxy: bool, retries=5):
-        url = f"{self.NEO_API}/v2/transfer?eoa={address}&amount={amount}&type={token_type}"
-        headers = {
-            **self.TESTNET_HEADERS[address],
-            "Authorization": f"Bearer {self.access_tokens[address]}",
-            "Cookie": self.header_cookies[address],
-            "Content-Length": "2",
-            "Content-Type": "application/json"
-        }
-        await asyncio.sleep(3)
-        for attempt in range(retries):
-            proxy_url = self.get_next_proxy_for_account(address) if use_proxy else None
-            connector, proxy, proxy_auth = self.build_proxy_config(proxy_url)
-            try:
-                async with ClientSession(connector=connector, timeout=ClientTimeout(total=60)) as session:
-                    async with session.post(url=url, headers=headers, json={}, proxy=proxy, proxy_auth=proxy_auth) as response:
-                        response.raise_for_status()
-                        return await response.json()
-            except (Exception, ClientResponseError) as e:
-                if attempt < retries - 1:
-                    await asyncio.sleep(5)
-                    continue
-                self.log(
-                    f"{Fore.BLUE + Style.BRIGHT}   Status  : {Style.RESET_ALL}"
-                    f"{Fore.RED+Style.BRIGHT}Withdraw Failed{Style.RESET_ALL}"
-                    f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
-                    f"{Fore.YELLOW+Style.BRIGHT}{str(e)}{Style.RESET_ALL}"
-                )
+        if headers:
+            request_headers.update(headers)
 
-        return None
+        return request_headers
     
-    async def staked_info(self, address: str, subnet_id: str, use_proxy: bool, retries=5):
-        url = f"{self.OZONE_API}/subnet/{subnet_id}/staked-info?id={subnet_id}"
-        headers = {
-            **self.TESTNET_HEADERS[address],
-            "Authorization": f"Bearer {self.access_tokens[address]}"
-        }
-        await asyncio.sleep(3)
-        for attempt in range(retries):
-            proxy_url = self.get_next_proxy_for_account(address) if use_proxy else None
-            connector, proxy, proxy_auth = self.build_proxy_config(proxy_url)
-            try:
-                async with ClientSession(connector=connector, timeout=ClientTimeout(total=60)) as session:
-                    async with session.get(url=url, headers=headers, proxy=proxy, proxy_auth=proxy_auth) as response:
-                        response.raise_for_status()
-                        return await response.json()
-            except (Exception, ClientResponseError) as e:
-                if attempt < retries - 1:
-                    await asyncio.sleep(5)
-                    continue
-                self.log(
-                    f"{Fore.BLUE + Style.BRIGHT}   Message : {Style.RESET_ALL}"
-                    f"{Fore.RED+Style.BRIGHT}Fetch Staked Balance Failed{Style.RESET_ALL}"
-                    f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
-                    f"{Fore.YELLOW+Style.BRIGHT}{str(e)}{Style.RESET_ALL}"
-                )
-
-        return None
-            
-    async def unstake_token(self, address: str, subnet_address: str, unstake_amount: int, use_proxy: bool, retries=5):
-        url = f"{self.OZONE_API}/subnet/undelegate"
-        data = json.dumps({"subnet_address":subnet_address, "amount":unstake_amount})
-        headers = {
-            **self.TESTNET_HEADERS[address],
-            "Authorization": f"Bearer {self.access_tokens[address]}",
-            "Content-Length": str(len(data)),
-            "Content-Type": "application/json"
-        }
-        await asyncio.sleep(3)
-        for attempt in range(retries):
-            proxy_url = self.get_next_proxy_for_account(address) if use_proxy else None
-            connector, proxy, proxy_auth = self.build_proxy_config(proxy_url)
-            try:
-                async with ClientSession(connector=connector, timeout=ClientTimeout(total=60)) as session:
-                    async with session.post(url=url, headers=headers, data=data, proxy=proxy, proxy_auth=proxy_auth) as response:
-                        if response.status == 500:
-                            result = await response.json()
-                            err_msg = result.get("error", "Unknown Error")
-
-                            if "Staking period too short" in err_msg:
-                                self.log(
-                                    f"{Fore.BLUE + Style.BRIGHT}   Status  : {Style.RESET_ALL}"
-                                    f"{Fore.RED+Style.BRIGHT}Unstake Failed{Style.RESET_ALL}"
-                                    f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
-                                    f"{Fore.YELLOW+Style.BRIGHT}{err_msg}{Style.RESET_ALL}"
-                                )
-                                return None
-
-                        response.raise_for_status()
-                        return await response.json()
-            except (Exception, ClientResponseError) as e:
-                if attempt < retries - 1:
-                    await asyncio.sleep(5)
-                    continue
-                self.log(
-                    f"{Fore.BLUE + Style.BRIGHT}   Status  : {Style.RESET_ALL}"
-                    f"{Fore.RED+Style.BRIGHT}Unstake Failed{Style.RESET_ALL}"
-                    f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
-                    f"{Fore.YELLOW+Style.BRIGHT}{str(e)}{Style.RESET_ALL}"
-                )
+    def record_request_timing(self, name: str, elapsed: float, success: bool):
+        stats = self.request_stats.setdefault(name, {"calls": 0, "failures": 0, "elapsed": 0.0, "max": 0.0})
+        stats["calls"] += 1
+        stats["elapsed"] += elapsed
+        stats["max"] = max(stats["max"], elapsed)
+        if not success:
+            stats["failures"] += 1
+    
+    def log_request_failure(self, endpoint: dict, error: Exception):
+        if endpoint.get("scope") == "account":
+            self.log(
+                f"{Fore.CYAN+Style.BRIGHT}Status    :{Style.RESET_ALL}"
+                f"{Fore.RED+Style.BRIGHT} {endpoint['error']} {Style.RESET_ALL}"
+                f"{Fore.MAGENTA+Style.BRIGHT}-{Style.RESET_ALL}"
+                f"{Fore.YELLOW+Style.BRIGHT} {str(error)} {Style.RESET_ALL}"
+            )
+        else:
+            self.log(
+                f"{Fore.BLUE + Style.BRIGHT}   {endpoint['label']:<8}: {Style.RESET_ALL}"
+                f"{Fore.RED+Style.BRIGHT}{endpoint['error']}{Style.RESET_ALL}"
+                f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
+                f"{Fore.YELLOW+Style.BRIGHT}{str(error)}{Style.RESET_ALL}"
+            )
+    
+    def get_retry_policy(self, name: str):
+        return {**self.RETRY_POLICY, **self.API_ENDPOINTS.get(name, {}).get("retry", {})}
+    
+    def parse_retry_after(self, value):
+        if not value:
+            return None
 
-        return None
-            
-    async def stake_token(self, address: str, subnet_address: str, stake_amount: int, use_proxy: bool, retries=5):
-        url = f"{self.OZONE_API}/subnet/delegate"
-        data = json.dumps({"subnet_address":subnet_address, "amount":stake_amount})
-        headers = {
-            **self.TESTNET_HEADERS[address],
-            "Authorization": f"Bearer {self.access_tokens[address]}",
-            "Content-Length": str(len(data)),
-            "Content-Type": "application/json"
-        }
-        await asyncio.sleep(3)
-        for attempt in range(retries):
-            proxy_url = self.get_next_proxy_for_account(address) if use_proxy else None
-            connector, proxy, proxy_auth = self.build_proxy_config(proxy_url)
-            try:
-                async with ClientSession(connector=connector, timeout=ClientTimeout(total=60)) as session:
-                    async with session.post(url=url, headers=headers, data=data, proxy=proxy, proxy_auth=proxy_auth) as response:
-                        response.raise_for_status()
-                        return await response.json()
-            except (Exception, ClientResponseError) as e:
-                if attempt < retries - 1:
-                    await asyncio.sleep(5)
-                    continue
-                self.log(
-                    f"{Fore.BLUE + Style.BRIGHT}   Status  : {Style.RESET_ALL}"
-                    f"{Fore.RED+Style.BRIGHT}Stake Failed{Style.RESET_ALL}"
-                    f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
-                    f"{Fore.YELLOW+Style.BRIGHT}{str(e)}{Style.RESET_ALL}"
-                )
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
 
-        return None
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+    
+    def is_retryable_error(self, policy: dict, error: Exception):
+        if isinstance(error, ClientResponseError):
+            return error.status not in policy["fatal_statuses"]
+        return True
+    
+    def retry_delay(self, policy: dict, attempt: int, error=None):
+        if isinstance(error, ClientResponseError) and error.status == 429 and error.headers:
+            retry_after = self.parse_retry_after(error.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, policy["max_retry_after"])
+
+        delay = min(policy["max_delay"], policy["base_delay"] * (2 ** attempt))
+        return random.uniform(delay / 2, delay)
+    
+    def should_retry_rate_limit(self, name: str, response):
+        retry_after = self.parse_retry_after(response.headers.get("Retry-After"))
+        return retry_after is not None and retry_after <= self.get_retry_policy(name)["max_retry_after"]
+    
+    def get_rate_bucket(self, host: str):
+        rate = self.RATE_LIMITS.get(host)
+        if not rate:
+            return None, None
 
-    async def claim_stake_rewards(self, address: str, subnet_address: str, use_proxy: bool, retries=5):
-        url = f"{self.OZONE_API}/subnet/claim-rewards"
-        data = json.dumps({"subnet_address":subnet_address})
-        headers = {
-            **self.TESTNET_HEADERS[address],
-            "Authorization": f"Bearer {self.access_tokens[address]}",
-            "Content-Length": str(len(data)),
-            "Content-Type": "application/json"
-        }
-        await asyncio.sleep(3)
-        for attempt in range(retries):
-            proxy_url = self.get_next_proxy_for_account(address) if use_proxy else None
-            connector, proxy, proxy_auth = self.build_proxy_config(proxy_url)
-            try:
-                async with ClientSession(connector=connector, timeout=ClientTimeout(total=60)) as session:
-                    async with session.post(url=url, headers=headers, data=data, proxy=proxy, proxy_auth=proxy_auth) as response:
-                        response.raise_for_status()
-                        return await response.json()
-            except (Exception, ClientResponseError) as e:
-                if attempt < retries - 1:
-                    await asyncio.sleep(5)
-                    continue
-                self.log(
-                    f"{Fore.BLUE + Style.BRIGHT}   Status  : {Style.RESET_ALL}"
-                    f"{Fore.RED+Style.BRIGHT}Claim Failed{Style.RESET_ALL}"
-                    f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
-                    f"{Fore.YELLOW+Style.BRIGHT}{str(e)}{Style.RESET_ALL}"
-                )
+        if host not in self.rate_buckets:
+            self.rate_buckets[host] = {"tokens": rate, "updated": time.monotonic(), "lock": asyncio.Lock()}
 
-        return None
+        return self.rate_buckets[host], rate
     
-    async def create_quiz(self, address: str, use_proxy: bool, retries=5):
-        url = f"{self.NEO_API}/v2/quiz/create"
-        data = json.dumps({"title":self.generate_quiz_title(), "num":1, "eoa":address})
-        headers = {
-            **self.TESTNET_HEADERS[address],
-            "Authorization": f"Bearer {self.access_tokens[address]}",
-            "Cookie": self.header_cookies[address],
-            "Content-Length": str(len(data)),
-            "Content-Type": "application/json"
-        }
-        await asyncio.sleep(3)
-        for attempt in range(retries):
-            proxy_url = self.get_next_proxy_for_account(address) if use_proxy else None
-            connector, proxy, proxy_auth = self.build_proxy_config(proxy_url)
-            try:
-                async with ClientSession(connector=connector, timeout=ClientTimeout(total=60)) as session:
-                    async with session.post(url=url, headers=headers, data=data, proxy=proxy, proxy_auth=proxy_auth) as response:
-                        response.raise_for_status()
-                        return await response.json()
-            except (Exception, ClientResponseError) as e:
-                if attempt < retries - 1:
-                    await asyncio.sleep(5)
-                    continue
-                self.log(
-                    f"{Fore.BLUE + Style.BRIGHT}   Message : {Style.RESET_ALL}"
-                    f"{Fore.RED+Style.BRIGHT}Fetch Today Quiz Failed{Style.RESET_ALL}"
-                    f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
-                    f"{Fore.YELLOW+Style.BRIGHT}{str(e)}{Style.RESET_ALL}"
-                )
-
-        return None
-        
-    async def get_quiz(self, address: str, quiz_id: int, use_proxy: bool, retries=5):
-        url = f"{self.NEO_API}/v2/quiz/get?id={quiz_id}&eoa={address}"
-        headers = {
-            **self.TESTNET_HEADERS[address],
-            "Authorization": f"Bearer {self.access_tokens[address]}",
-            "Cookie": self.header_cookies[address]
-        }
-        await asyncio.sleep(3)
-        for attempt in range(retries):
-            proxy_url = self.get_next_proxy_for_account(address) if use_proxy else None
-            connector, proxy, proxy_auth = self.build_proxy_config(proxy_url)
-            try:
-                async with ClientSession(connector=connector, timeout=ClientTimeout(total=60)) as session:
-                    async with session.get(url=url, headers=headers, proxy=proxy, proxy_auth=proxy_auth) as response:
-                        response.raise_for_status()
-                        return await response.json()
-            except (Exception, ClientResponseError) as e:
-                if attempt < retries - 1:
-                    await asyncio.sleep(5)
-                    continue
-                self.log(
-                    f"{Fore.BLUE + Style.BRIGHT}   Message : {Style.RESET_ALL}"
-                    f"{Fore.RED+Style.BRIGHT}Fetch Question & Answer Failed{Style.RESET_ALL}"
-                    f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
-                    f"{Fore.YELLOW+Style.BRIGHT}{str(e)}{Style.RESET_ALL}"
-                )
+    async def acquire_rate_limit(self, url: str):
+        host = urlparse(url).hostname
+        bucket, rate = self.get_rate_bucket(host)
+        if bucket is None:
+            return 0.0
+
+        started = time.monotonic()
+        async with bucket["lock"]:
+            while True:
+                now = time.monotonic()
+                bucket["tokens"] = min(rate, bucket["tokens"] + (now - bucket["updated"]) * rate)
+                bucket["updated"] = now
 
-        return None
-            
-    async def submit_quiz(self, address: str, quiz_id: int, question_id: int, quiz_answer: str, use_proxy: bool, retries=5):
-        url = f"{self.NEO_API}/v2/quiz/submit"
-        data = json.dumps({"quiz_id":quiz_id, "question_id":question_id, "answer":quiz_answer, "finish":True, "eoa":address})
-        headers = {
-            **self.TESTNET_HEADERS[address],
-            "Authorization": f"Bearer {self.access_tokens[address]}",
-            "Cookie": self.header_cookies[address],
-            "Content-Length": str(len(data)),
-            "Content-Type": "application/json"
-        }
-        await asyncio.sleep(3)
-        for attempt in range(retries):
-            proxy_url = self.get_next_proxy_for_account(address) if use_proxy else None
-            connector, proxy, proxy_auth = self.build_proxy_config(proxy_url)
-            try:
-                async with ClientSession(connector=connector, timeout=ClientTimeout(total=60)) as session:
-                    async with session.post(url=url, headers=headers, data=data, proxy=proxy, proxy_auth=proxy_auth) as response:
-                        response.raise_for_status()
-                        return await response.json()
-            except (Exception, ClientResponseError) as e:
-                if attempt < retries - 1:
-                    await asyncio.sleep(5)
-                    continue
-                self.log(
-                    f"{Fore.BLUE + Style.BRIGHT}   Status  : {Style.RESET_ALL}"
-                    f"{Fore.RED+Style.BRIGHT}Submit Answer Failed{Style.RESET_ALL}"
-                    f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
-                    f"{Fore.YELLOW+Style.BRIGHT}{str(e)}{Style.RESET_ALL}"
-                )
+                if bucket["tokens"] >= 1:
+                    bucket["tokens"] -= 1
+                    break
 
-        return None
-            
-    async def agent_inference(self, address: str, service_id: str, question: str, use_proxy: bool, retries=5):
-        url = f"{self.OZONE_API}/agent/inference"
-        data = json.dumps(self.generate_inference_payload(service_id, question))
-        headers = {
-            **self.TESTNET_HEADERS[address],
-            "Authorization": f"Bearer {self.access_tokens[address]}",
-            "Content-Length": str(len(data)),
-            "Content-Type": "application/json"
-        }
-        await asyncio.sleep(3)
-        for attempt in range(retries):
-            proxy_url = self.get_next_proxy_for_account(address) if use_proxy else None
-            connector, proxy, proxy_auth = self.build_proxy_config(proxy_url)
-            try:
-                async with ClientSession(connector=connector, timeout=ClientTimeout(total=60)) as session:
-                    async with session.post(url=url, headers=headers, data=data, proxy=proxy, proxy_auth=proxy_auth) as response:
-                        if response.status == 429:
-                            result = await response.json()
-                            err_msg = result.get("error", "Unknown Error")
-
-                            self.log(
-                                f"{Fore.BLUE + Style.BRIGHT}   Status  : {Style.RESET_ALL}"
-                                f"{Fore.RED+Style.BRIGHT}Agents Didn't Respond{Style.RESET_ALL}"
-                                f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
-                                f"{Fore.YELLOW+Style.BRIGHT}{err_msg}{Style.RESET_ALL}"
-                            )
-                            return None
-                        
-                        response.raise_for_status()
-                        result = ""
+                await asyncio.sleep((1 - bucket["tokens"]) / rate)
 
-                        async for line in response.content:
-                            line = line.decode("utf-8").strip()
-                            if not line.startswith("data:"):
-                                continue
+        waited = time.monotonic() - started
+        stats = self.rate_limit_stats.setdefault(host, {"requests": 0, "waited": 0.0, "max": 0.0})
+        stats["requests"] += 1
+        stats["waited"] += waited
+        stats["max"] = max(stats["max"], waited)
 
-                            if line == "data: [DONE]":
-                                return result.strip()
+        return waited
+    
+    def penalize_rate_limit(self, url: str, delay: float):
+        bucket, rate = self.get_rate_bucket(urlparse(url).hostname)
+        if bucket is not None:
+            bucket["tokens"] = min(bucket["tokens"], -delay * rate)
+    
+    async def api_request(self, name: str, address: str, use_proxy: bool, params=None, payload=None, headers=None, retries=None):
+        endpoint = self.API_ENDPOINTS[name]
+        policy = self.get_retry_policy(name)
+        retries = retries or policy["retries"]
+        url = f"{getattr(self, endpoint['api'])}{endpoint['path'].format(address=address, **(params or {}))}"
 
-                            try:
-                                json_data = json.loads(line[len("data:"):].strip())
-                                delta = json_data.get("choices", [{}])[0].get("delta", {})
-                                content = delta.get("content")
-                                if content:
-                                    result += content
-                            except json.JSONDecodeError:
-                                continue
+        data = None
+        if endpoint.get("body") == "json":
+            data = json.dumps(payload)
+        elif endpoint.get("body") == "empty":
+            data = "{}"
 
-                        return result.strip()
-            except (Exception, ClientResponseError) as e:
-                if attempt < retries - 1:
-                    await asyncio.sleep(5)
-                    continue
-                self.log(
-                    f"{Fore.BLUE + Style.BRIGHT}   Status  : {Style.RESET_ALL}"
-                    f"{Fore.RED+Style.BRIGHT}Agents Didn't Respond{Style.RESET_ALL}"
-                    f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
-                    f"{Fore.YELLOW+Style.BRIGHT}{str(e)}{Style.RESET_ALL}"
-                )
+        request_headers = self.build_endpoint_headers(endpoint, address, data, headers)
+        handler = getattr(self, endpoint["handler"]) if endpoint.get("handler") else None
 
-        return None
-            
-    async def submit_receipt(self, address: str, service_id: str, question: str, answer: str, use_proxy: bool, retries=5):
-        url = f"{self.NEO_API}/v2/submit_receipt"
-        data = json.dumps(self.generate_receipt_payload(self.aa_address[address], service_id, question, answer))
-        headers = {
-            **self.TESTNET_HEADERS[address],
-            "Authorization": f"Bearer {self.access_tokens[address]}",
-            "Cookie": self.header_cookies[address],
-            "Content-Length": str(len(data)),
-            "Content-Type": "application/json"
-        }
-        await asyncio.sleep(3)
         for attempt in range(retries):
             proxy_url = self.get_next_proxy_for_account(address) if use_proxy else None
-            connector, proxy, proxy_auth = self.build_proxy_config(proxy_url)
+            session, proxy, proxy_auth = self.get_session(address, proxy_url)
+            await self.acquire_rate_limit(url)
+            started = time.perf_counter()
+            lease = self.acquire_connector(proxy_url)
             try:
-                async with ClientSession(connector=connector, timeout=ClientTimeout(total=60)) as session:
-                    async with session.post(url=url, headers=headers, data=data, proxy=proxy, proxy_auth=proxy_auth) as response:
-                        response.raise_for_status()
-                        return await response.json()
+                try:
+                    async with session.request(endpoint["method"], url=url, headers=request_headers, data=data, proxy=proxy, proxy_auth=proxy_auth) as response:
+                        if handler:
+                            result = await handler(address, response)
+                        else:
+                            response.raise_for_status()
+                            result = await response.json()
+                finally:
+                    self.release_connector(lease)
+
+                self.record_request_timing(name, time.perf_counter() - started, True)
+                if proxy_url:
+                    self.record_proxy_result(proxy_url)
+                return result
             except (Exception, ClientResponseError) as e:
-                if attempt < retries - 1:
-                    await asyncio.sleep(5)
+                self.record_request_timing(name, time.perf_counter() - started, False)
+                if proxy_url and isinstance(e, (ClientConnectionError, ProxyError, asyncio.TimeoutError)):
+                    self.record_proxy_result(proxy_url, e)
+                if attempt < retries - 1 and self.is_retryable_error(policy, e):
+                    delay = self.retry_delay(policy, attempt, e)
+                    if isinstance(e, ClientResponseError) and e.status == 429:
+                        self.penalize_rate_limit(url, delay)
+                    await asyncio.sleep(delay)
                     continue
-                self.log(
-                    f"{Fore.BLUE + Style.BRIGHT}   Status  : {Style.RESET_ALL}"
-                    f"{Fore.RED+Style.BRIGHT}Submit Receipt Failed{Style.RESET_ALL}"
-                    f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
-                    f"{Fore.YELLOW+Style.BRIGHT}{str(e)}{Style.RESET_ALL}"
-                )
+                self.log_request_failure(endpoint, e)
+                break
 
         return None
-            
-    async def get_inference(self, address: str, inference_id: str, use_proxy: bool, retries=5):
-        url = f"{self.NEO_API}/v1/inference?id={inference_id}"
-        headers = {
-            **self.TESTNET_HEADERS[address],
-            "Authorization": f"Bearer {self.access_tokens[address]}",
-            "Cookie": self.header_cookies[address]
-        }
-        await asyncio.sleep(3)
-        for attempt in range(retries):
-            proxy_url = self.get_next_proxy_for_account(address) if use_proxy else None
-            connector, proxy, proxy_auth = self.build_proxy_config(proxy_url)
-            try:
-                async with ClientSession(connector=connector, timeout=ClientTimeout(total=60)) as session:
-                    async with session.get(url=url, headers=headers, proxy=proxy, proxy_auth=proxy_auth) as response:
-                        response.raise_for_status()
-                        result = await response.json()
+    
+    async def handle_signin_response(self, address: str, response):
+        response.raise_for_status()
+        result = await response.json()
 
-                        tx_hash = result.get("data", {}).get("tx_hash", "")
-                        if tx_hash == "":
-                            raise Exception("Tx Hash Is None")
+        raw_cookies = response.headers.getall('Set-Cookie', [])
+        if not raw_cookies:
+            raise Exception("Session Cookie Not Found")
 
-                        return tx_hash
-            except (Exception, ClientResponseError) as e:
-                if attempt < retries - 1:
-                    await asyncio.sleep(5)
-                    continue
-                self.log(
-                    f"{Fore.BLUE + Style.BRIGHT}   Message : {Style.RESET_ALL}"
-                    f"{Fore.RED+Style.BRIGHT}Fetch Inference Failed{Style.RESET_ALL}"
-                    f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
-                    f"{Fore.YELLOW+Style.BRIGHT}{str(e)}{Style.RESET_ALL}"
-                )
+        cookie = SimpleCookie()
+        cookie.load("\n".join(raw_cookies))
+        cookie_string = "; ".join([f"{key}={morsel.value}" for key, morsel in cookie.items()])
+        self.header_cookies[address] = cookie_string
 
-        return None
+        return result
     
-    async def owner_safes_wallet(self, address: str, use_proxy: bool, retries=5):
-        url = f"{self.MULTISIG_API}/chains/2368/owners/{address}/safes"
-        await asyncio.sleep(3)
-        for attempt in range(retries):
-            proxy_url = self.get_next_proxy_for_account(address) if use_proxy else None
-            connector, proxy, proxy_auth = self.build_proxy_config(proxy_url)
-            try:
-                async with ClientSession(connector=connector, timeout=ClientTimeout(total=60)) as session:
-                    async with session.get(url=url, headers=self.MULTISIG_HEADERS[address], proxy=proxy, proxy_auth=proxy_auth) as response:
-                        response.raise_for_status()
-                        return await response.json()
-            except (Exception, ClientResponseError) as e:
-                if attempt < retries - 1:
-                    await asyncio.sleep(5)
-                    continue
+    async def handle_faucet_response(self, address: str, response):
+        if response.status == 429 and not self.should_retry_rate_limit("claim_bridge_faucet", response):
+            result = await response.json()
+            err_msg = result.get("message", "Unknown Error")
+            self.log(
+                f"{Fore.BLUE + Style.BRIGHT}   Status  : {Style.RESET_ALL}"
+                f"{Fore.RED+Style.BRIGHT}Not Time to Claim{Style.RESET_ALL}"
+                f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
+                f"{Fore.YELLOW+Style.BRIGHT}{err_msg}{Style.RESET_ALL}"
+            )
+            return None
+
+        response.raise_for_status()
+        return await response.json()
+    
+    async def handle_unstake_response(self, address: str, response):
+        if response.status == 500:
+            result = await response.json()
+            err_msg = result.get("error", "Unknown Error")
+
+            if "Staking period too short" in err_msg:
                 self.log(
-                    f"{Fore.BLUE+Style.BRIGHT}   Message : {Style.RESET_ALL}"
-                    f"{Fore.RED+Style.BRIGHT}Fetch Salt Nonce Failed{Style.RESET_ALL}"
+                    f"{Fore.BLUE + Style.BRIGHT}   Status  : {Style.RESET_ALL}"
+                    f"{Fore.RED+Style.BRIGHT}Unstake Failed{Style.RESET_ALL}"
                     f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
-                    f"{Fore.YELLOW+Style.BRIGHT}{str(e)}{Style.RESET_ALL}"
+                    f"{Fore.YELLOW+Style.BRIGHT}{err_msg}{Style.RESET_ALL}"
                 )
+                return None
 
-        return None
+        response.raise_for_status()
+        return await response.json()
     
-    async def submit_bridge_transfer(self, address: str, src_chain_id: int, dest_chain_id: int, src_address: str, dest_address: str, amount_to_wei: int, tx_hash: str, use_proxy: bool, retries=5):
-        url = f"{self.BRIDGE_API}/bridge-transfer"
-        data = json.dumps(self.generate_bridge_payload(address, src_chain_id, dest_chain_id, src_address, dest_address, amount_to_wei, tx_hash))
-        headers = {
-            **self.BRIDGE_HEADERS[address],
-            "Content-Length": str(len(data)),
-            "Content-Type": "application/json"
-        }
-        await asyncio.sleep(3)
-        for attempt in range(retries):
-            proxy_url = self.get_next_proxy_for_account(address) if use_proxy else None
-            connector, proxy, proxy_auth = self.build_proxy_config(proxy_url)
+    async def handle_inference_stream(self, address: str, response):
+        if response.status == 429 and not self.should_retry_rate_limit("agent_inference", response):
+            result = await response.json()
+            err_msg = result.get("error", "Unknown Error")
+
+            self.log(
+                f"{Fore.BLUE + Style.BRIGHT}   Status  : {Style.RESET_ALL}"
+                f"{Fore.RED+Style.BRIGHT}Agents Didn't Respond{Style.RESET_ALL}"
+                f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
+                f"{Fore.YELLOW+Style.BRIGHT}{err_msg}{Style.RESET_ALL}"
+            )
+            return None
+        
+        response.raise_for_status()
+        result = ""
+
+        async for line in response.content:
+            line = line.decode("utf-8").strip()
+            if not line.startswith("data:"):
+                continue
+
+            if line == "data: [DONE]":
+                return result.strip()
+
             try:
-                async with ClientSession(connector=connector, timeout=ClientTimeout(total=60)) as session:
-                    async with session.post(url=url, headers=headers, data=data, proxy=proxy, proxy_auth=proxy_auth) as response:
-                        response.raise_for_status()
-                        return await response.json()
-            except (Exception, ClientResponseError) as e:
-                if attempt < retries - 1:
-                    await asyncio.sleep(5)
-                    continue
-                self.log(
-                    f"{Fore.BLUE+Style.BRIGHT}   Submit  : {Style.RESET_ALL}"
-                    f"{Fore.RED+Style.BRIGHT}Failed{Style.RESET_ALL}"
-                    f"{Fore.MAGENTA+Style.BRIGHT} - {Style.RESET_ALL}"
-                    f"{Fore.YELLOW+Style.BRIGHT}{str(e)}{Style.RESET_ALL}"
-                )
+                json_data = json.loads(line[len("data:"):].strip())
+                delta = json_data.get("choices", [{}])[0].get("delta", {})
+                content = delta.get("content")
+                if content:
+                    result += content
+            except json.JSONDecodeError:
+                continue
 
-        return None
+        return result.strip()
+    
+    async def handle_inference_response(self, address: str, response):
+        response.raise_for_status()
+        result = await response.json()
+
+        tx_hash = result.get("data", {}).get("tx_hash", "")
+        if tx_hash == "":
+            raise Exception("Tx Hash Is None")
+
+        return tx_hash
+    
+    async def user_signin(self, address: str, use_proxy: bool, retries=None):
+        return await self.api_request("user_signin", address, use_proxy, payload={"eoa":address}, retries=retries)
+    
+    async def user_data(self, address: str, use_proxy: bool, retries=None):
+        return await self.api_request("user_data", address, use_proxy, retries=retries)
+    
+    async def claim_testnet_faucet(self, address: str, recaptcha_token: str, use_proxy: bool, retries=None):
+        return await self.api_request("claim_testnet_faucet", address, use_proxy, headers={"x-recaptcha-token": recaptcha_token}, retries=retries)
+    
+    async def claim_bridge_faucet(self, address: str, payload: dict, use_proxy: bool, retries=None):
+        return await self.api_request("claim_bridge_faucet", address, use_proxy, payload=payload, retries=retries)
+            
+    async def token_balance(self, address: str, use_proxy: bool, retries=None):
+        return await self.api_request("token_balance", address, use_proxy, retries=retries)
+    
+    async def withdraw_token(self, address: str, amount: int, token_type: str, use_proxy: bool, retries=None):
+        return await self.api_request("withdraw_token", address, use_proxy, params={"amount":amount, "token_type":token_type}, retries=retries)
+    
+    async def staked_info(self, address: str, subnet_id: str, use_proxy: bool, retries=None):
+        return await self.api_request("staked_info", address, use_proxy, params={"subnet_id":subnet_id}, retries=retries)
+            
+    async def unstake_token(self, address: str, subnet_address: str, unstake_amount: int, use_proxy: bool, retries=None):
+        payload = {"subnet_address":subnet_address, "amount":unstake_amount}
+        return await self.api_request("unstake_token", address, use_proxy, payload=payload, retries=retries)
+            
+    async def stake_token(self, address: str, subnet_address: str, stake_amount: int, use_proxy: bool, retries=None):
+        payload = {"subnet_address":subnet_address, "amount":stake_amount}
+        return await self.api_request("stake_token", address, use_proxy, payload=payload, retries=retries)
+
+    async def claim_stake_rewards(self, address: str, subnet_address: str, use_proxy: bool, retries=None):
+        payload = {"subnet_address":subnet_address}
+        return await self.api_request("claim_stake_rewards", address, use_proxy, payload=payload, retries=retries)
+    
+    async def create_quiz(self, address: str, use_proxy: bool, retries=None):
+        payload = {"title":self.generate_quiz_title(), "num":1, "eoa":address}
+        return await self.api_request("create_quiz", address, use_proxy, payload=payload, retries=retries)
+        
+    async def get_quiz(self, address: str, quiz_id: int, use_proxy: bool, retries=None):
+        return await self.api_request("get_quiz", address, use_proxy, params={"quiz_id":quiz_id}, retries=retries)
+            
+    async def submit_quiz(self, address: str, quiz_id: int, question_id: int, quiz_answer: str, use_proxy: bool, retries=None):
+        payload = {"quiz_id":quiz_id, "question_id":question_id, "answer":quiz_answer, "finish":True, "eoa":address}
+        return await self.api_request("submit_quiz", address, use_proxy, payload=payload, retries=retries)
+            
+    async def agent_inference(self, address: str, service_id: str, question: str, use_proxy: bool, retries=None):
+        payload = self.generate_inference_payload(service_id, question)
+        return await self.api_request("agent_inference", address, use_proxy, payload=payload, retries=retries)
+            
+    async def submit_receipt(self, address: str, service_id: str, question: str, answer: str, use_proxy: bool, retries=None):
+        payload = self.generate_receipt_payload(self.aa_address[address], service_id, question, answer)
+        return await self.api_request("submit_receipt", address, use_proxy, payload=payload, retries=retries)
+            
+    async def get_inference(self, address: str, inference_id: str, use_proxy: bool, retries=None):
+        return await self.api_request("get_inference", address, use_proxy, params={"inference_id":inference_id}, retries=retries)
+    
+    async def owner_safes_wallet(self, address: str, use_proxy: bool, retries=None):
+        return await self.api_request("owner_safes_wallet", address, use_proxy, retries=retries)
+    
+    async def submit_bridge_transfer(self, address: str, src_chain_id: int, dest_chain_id: int, src_address: str, dest_address: str, amount_to_wei: int, tx_hash: str, use_proxy: bool, retries=None):
+        payload = self.generate_bridge_payload(address, src_chain_id, dest_chain_id, src_address, dest_address, amount_to_wei, tx_hash)
+        return await self.api_request("submit_bridge_transfer", address, use_proxy, payload=payload, retries=retries)
     
     async def process_perform_deposit(self, account: str, address: str, receiver: str, use_proxy: bool):
         tx_hash, block_number = await self.perform_deposit(account, address, receiver, use_proxy)
@@ -1938,6 +2769,7 @@ class KiteAI:
     async def process_perform_withdraw(self, address: str, withdraw_amount: int, token_type: str, use_proxy: bool):
         withdraw = await self.withdraw_token(address, withdraw_amount, token_type, use_proxy)
         if withdraw:
+            self.invalidate_token_balances(address)
             tx_hash = withdraw.get("data", {}).get("receipt", {}).get("transactionHash")
             self.log(
                 f"{Fore.BLUE+Style.BRIGHT}   Status  : {Style.RESET_ALL}"
@@ -1953,16 +2785,72 @@ class KiteAI:
             )
 
     async def process_perform_create_proxy(self, account: str, address: str, salt_nonce: int, use_proxy: bool):
-        tx_hash, block_number, proxy_address = await self.perform_create_proxy(account, address, salt_nonce, use_proxy)
-        if tx_hash and block_number and proxy_address:
+        tx_hash, receipt_task, proxy_address = await self.perform_create_proxy(account, address, salt_nonce, use_proxy)
+        if tx_hash and receipt_task and proxy_address:
             self.log(
                 f"{Fore.BLUE+Style.BRIGHT}   Status  : {Style.RESET_ALL}"
-                f"{Fore.GREEN+Style.BRIGHT}Success{Style.RESET_ALL}                                              "
+                f"{Fore.GREEN+Style.BRIGHT}Submitted{Style.RESET_ALL}                                              "
+            )
+            self.log(
+                f"{Fore.BLUE+Style.BRIGHT}   Tx Hash : {Style.RESET_ALL}"
+                f"{Fore.WHITE+Style.BRIGHT}{tx_hash}{Style.RESET_ALL}"
+            )
+            return tx_hash, receipt_task, proxy_address
+        
+        self.log(
+            f"{Fore.BLUE+Style.BRIGHT}   Status  : {Style.RESET_ALL}"
+            f"{Fore.RED+Style.BRIGHT}Perform On-Chain Failed{Style.RESET_ALL}"
+        )
+        return None
+
+    async def process_confirm_create_proxy(self, tx_hash: str, receipt_task: asyncio.Task, proxy_address: str):
+        try:
+            tx_hash, receipt = await receipt_task
+            block_number = receipt.blockNumber
+        except Exception as e:
+            self.log(
+                f"{Fore.BLUE+Style.BRIGHT}   Message : {Style.RESET_ALL}"
+                f"{Fore.RED+Style.BRIGHT}{str(e)}{Style.RESET_ALL}"
+            )
+            self.log(
+                f"{Fore.BLUE+Style.BRIGHT}   Status  : {Style.RESET_ALL}"
+                f"{Fore.RED+Style.BRIGHT}Perform On-Chain Failed{Style.RESET_ALL}"
             )
+            return
+
+        self.log(
+            f"{Fore.BLUE+Style.BRIGHT}   Status  : {Style.RESET_ALL}"
+            f"{Fore.GREEN+Style.BRIGHT}Success{Style.RESET_ALL}                                              "
+        )
+        self.log(
+            f"{Fore.BLUE+Style.BRIGHT}   Address : {Style.RESET_ALL}"
+            f"{Fore.WHITE+Style.BRIGHT}{proxy_address}{Style.RESET_ALL}"
+        )
+        self.log(
+            f"{Fore.BLUE+Style.BRIGHT}   Block   : {Style.RESET_ALL}"
+            f"{Fore.WHITE+Style.BRIGHT}{block_number}{Style.RESET_ALL}"
+        )
+        self.log(
+            f"{Fore.BLUE+Style.BRIGHT}   Tx Hash : {Style.RESET_ALL}"
+            f"{Fore.WHITE+Style.BRIGHT}{tx_hash}{Style.RESET_ALL}"
+        )
+        self.log(
+            f"{Fore.BLUE+Style.BRIGHT}   Explorer: {Style.RESET_ALL}"
+            f"{Fore.WHITE+Style.BRIGHT}{self.KITE_AI['explorer']}{tx_hash}{Style.RESET_ALL}"
+        )
+
+    async def process_perform_create_proxy_batch(self, account: str, address: str, salt_nonces: list, use_proxy: bool):
+        tx_hash, block_number, proxy_addresses = await self.perform_create_proxy_batch(account, address, salt_nonces, use_proxy)
+        if tx_hash and block_number and proxy_addresses:
             self.log(
-                f"{Fore.BLUE+Style.BRIGHT}   Address : {Style.RESET_ALL}"
-                f"{Fore.WHITE+Style.BRIGHT}{proxy_address}{Style.RESET_ALL}"
+                f"{Fore.BLUE+Style.BRIGHT}   Status  : {Style.RESET_ALL}"
+                f"{Fore.GREEN+Style.BRIGHT}Success{Style.RESET_ALL}                                              "
             )
+            for proxy_address in proxy_addresses:
+                self.log(
+                    f"{Fore.BLUE+Style.BRIGHT}   Address : {Style.RESET_ALL}"
+                    f"{Fore.WHITE+Style.BRIGHT}{proxy_address}{Style.RESET_ALL}"
+                )
             self.log(
                 f"{Fore.BLUE+Style.BRIGHT}   Block   : {Style.RESET_ALL}"
                 f"{Fore.WHITE+Style.BRIGHT}{block_number}{Style.RESET_ALL}"
@@ -2050,7 +2938,7 @@ class KiteAI:
         if is_claimable:
             self.log(f"{Fore.YELLOW + Style.BRIGHT}   Solving Recaptcha...{Style.RESET_ALL}")
 
-            recaptcha_token = await self.solve_recaptcha(self.TESTNET_SITE_KEY, self.TESTNET_API)
+            recaptcha_token = await self.get_recaptcha_token(self.TESTNET_SITE_KEY, self.TESTNET_API, address)
             if recaptcha_token:
                 self.log(
                     f"{Fore.BLUE + Style.BRIGHT}   Message : {Style.RESET_ALL}"
@@ -2059,12 +2947,14 @@ class KiteAI:
 
                 claim = await self.claim_testnet_faucet(address, recaptcha_token, use_proxy)
                 if claim:
+                    self.invalidate_token_balances(address)
                     self.log(
                         f"{Fore.BLUE + Style.BRIGHT}   Status  : {Style.RESET_ALL}"
                         f"{Fore.GREEN + Style.BRIGHT}Claimed Successfully{Style.RESET_ALL}"
                     )
 
         else:
+            self.skip_captcha_claim(self.TESTNET_SITE_KEY, self.TESTNET_API, address)
             self.log(
                 f"{Fore.BLUE + Style.BRIGHT}   Status  : {Style.RESET_ALL}"
                 f"{Fore.YELLOW + Style.BRIGHT}Not Time to Claim{Style.RESET_ALL}"
@@ -2078,7 +2968,7 @@ class KiteAI:
 
             self.log(f"{Fore.YELLOW + Style.BRIGHT}   Solving Recaptcha... {Style.RESET_ALL}")
 
-            recaptcha_token = await self.solve_recaptcha(self.FAUCET_SITE_KEY, self.FAUCET_API)
+            recaptcha_token = await self.get_recaptcha_token(self.FAUCET_SITE_KEY, self.FAUCET_API, address)
             if recaptcha_token:
                 self.log(
                     f"{Fore.BLUE + Style.BRIGHT}   Message : {Style.RESET_ALL}"
@@ -2092,6 +2982,7 @@ class KiteAI:
 
                 claim = await self.claim_bridge_faucet(address, payload, use_proxy)
                 if claim:
+                    self.invalidate_token_balances(address)
                     tx_hash = claim.get("txHash")
 
                     self.log(
@@ -2500,6 +3391,17 @@ class KiteAI:
     async def process_option_9(self, account: str, address: str, use_proxy: bool):
         self.log(f"{Fore.CYAN+Style.BRIGHT}Multisig  :{Style.RESET_ALL}                                              ")
 
+        if self.multisig_batch_size > 1:
+            if await self.has_multicall3(address, use_proxy):
+                return await self.process_create_proxy_batches(account, address, use_proxy)
+
+            self.log(
+                f"{Fore.BLUE+Style.BRIGHT}   Message : {Style.RESET_ALL}"
+                f"{Fore.YELLOW+Style.BRIGHT}Multicall3 Not Deployed, Creating One By One{Style.RESET_ALL}"
+            )
+
+        submitted = []
+
         for i in range(self.multisig_count):
             self.log(
                 f"{Fore.BLUE+Style.BRIGHT} ● {Style.RESET_ALL}"
@@ -2509,14 +3411,49 @@ class KiteAI:
                 f"{Fore.WHITE+Style.BRIGHT} {self.multisig_count} {Style.RESET_ALL}                                              "
             )
 
-            safes = await self.owner_safes_wallet(address, use_proxy)
-            if not safes: continue
+            salt_nonce = await self.reserve_salt_nonce(address, use_proxy)
+            if salt_nonce is None: return
 
-            salt_nonce = len(safes.get("safes", []))
+            result = await self.process_perform_create_proxy(account, address, salt_nonce, use_proxy)
+            if result:
+                submitted.append(result)
+            else:
+                self.release_salt_nonce(address, salt_nonce)
 
-            await self.process_perform_create_proxy(account, address, salt_nonce, use_proxy)
             await self.print_timer("Transactions")
 
+        for i, (tx_hash, receipt_task, proxy_address) in enumerate(submitted):
+            self.log(
+                f"{Fore.BLUE+Style.BRIGHT} ● {Style.RESET_ALL}"
+                f"{Fore.GREEN+Style.BRIGHT}Confirm{Style.RESET_ALL}"
+                f"{Fore.WHITE+Style.BRIGHT} {i+1} {Style.RESET_ALL}"
+                f"{Fore.MAGENTA+Style.BRIGHT}-{Style.RESET_ALL}"
+                f"{Fore.WHITE+Style.BRIGHT} {len(submitted)} {Style.RESET_ALL}                                              "
+            )
+            await self.process_confirm_create_proxy(tx_hash, receipt_task, proxy_address)
+
+    async def process_create_proxy_batches(self, account: str, address: str, use_proxy: bool):
+        for start in range(0, self.multisig_count, self.multisig_batch_size):
+            end = min(start + self.multisig_batch_size, self.multisig_count)
+            self.log(
+                f"{Fore.BLUE+Style.BRIGHT} ● {Style.RESET_ALL}"
+                f"{Fore.GREEN+Style.BRIGHT}Create{Style.RESET_ALL}"
+                f"{Fore.WHITE+Style.BRIGHT} {start+1}-{end} {Style.RESET_ALL}"
+                f"{Fore.MAGENTA+Style.BRIGHT}-{Style.RESET_ALL}"
+                f"{Fore.WHITE+Style.BRIGHT} {self.multisig_count} {Style.RESET_ALL}                                              "
+            )
+
+            salt_nonces = []
+            for _ in range(end - start):
+                salt_nonce = await self.reserve_salt_nonce(address, use_proxy)
+                if salt_nonce is None: return
+                salt_nonces.append(salt_nonce)
+
+            await self.process_perform_create_proxy_batch(account, address, salt_nonces, use_proxy)
+
+            if end < self.multisig_count:
+                await self.print_timer("Transactions")
+
     async def process_option_10(self, account: str, address: str, use_proxy: bool):
         self.log(f"{Fore.CYAN+Style.BRIGHT}Swap      :{Style.RESET_ALL}                                              ")
 
@@ -2613,11 +3550,21 @@ class KiteAI:
                 f"{Fore.WHITE+Style.BRIGHT} {proxy} {Style.RESET_ALL}"
             )
 
-            is_valid = await self.check_connection(proxy)
+            if proxy is None:
+                is_valid = await self.check_connection(proxy)
+            else:
+                is_valid = self.is_proxy_healthy(proxy)
+                if not is_valid:
+                    self.log(
+                        f"{Fore.CYAN+Style.BRIGHT}Status    :{Style.RESET_ALL}"
+                        f"{Fore.RED+Style.BRIGHT} Proxy Unhealthy {Style.RESET_ALL}"
+                        f"{Fore.MAGENTA+Style.BRIGHT}-{Style.RESET_ALL}"
+                        f"{Fore.YELLOW+Style.BRIGHT} {self.get_proxy_health(proxy)['failures']} Failures {Style.RESET_ALL}"
+                    )
+
             if not is_valid:
-                if rotate_proxy:
+                if rotate_proxy and proxy is not None and self.get_healthy_proxies():
                     proxy = self.rotate_proxy_for_account(address)
-                    await asyncio.sleep(1)
                     continue
 
                 return False
@@ -2641,12 +3588,91 @@ class KiteAI:
 
             return False
         
+    async def run_feature_option(self, option: int, account: str, address: str, user: dict, use_proxy: bool):
+        if option == 1:
+            await self.process_option_1(address, user, use_proxy)
+
+        elif option == 2:
+            await self.process_option_2(account, address, use_proxy)
+
+        elif option == 3:
+            await self.process_option_3(address, use_proxy)
+
+        elif option == 4:
+            await self.process_option_4(address, use_proxy)
+
+        elif option == 5:
+            await self.process_option_5(address, use_proxy)
+
+        elif option == 6:
+            await self.process_option_6(address, use_proxy)
+
+        elif option == 7:
+            await self.process_option_7(address, use_proxy)
+
+        elif option == 8:
+            await self.process_option_8(address, use_proxy)
+
+        elif option == 9:
+            await self.process_option_9(account, address, use_proxy)
+
+        elif option == 10:
+            await self.process_option_10(account, address, use_proxy)
+
+        elif option == 11:
+            await self.process_option_11(account, address, use_proxy)
+
+    def resolve_feature_dependencies(self, option: int, enabled: set):
+        dependencies = set()
+        for dependency in self.FEATURE_TASKS[option]["deps"]:
+            if dependency in enabled:
+                dependencies.add(dependency)
+            else:
+                dependencies |= self.resolve_feature_dependencies(dependency, enabled)
+
+        return dependencies
+
+    async def run_feature_task(self, option: int, tasks: dict, locks: dict, enabled: set, account: str, address: str, user: dict, use_proxy: bool):
+        feature = self.FEATURE_TASKS[option]
+
+        dependencies = [tasks[dependency] for dependency in self.resolve_feature_dependencies(option, enabled)]
+        if dependencies:
+            await asyncio.gather(*dependencies, return_exceptions=True)
+
+        context = account_context.get()
+        account_context.set(f"{context} | {feature['label']}" if context else feature["label"])
+
+        async with AsyncExitStack() as stack:
+            for resource in sorted(set(feature["resources"]) - {"api"}):
+                await stack.enter_async_context(locks.setdefault(resource, asyncio.Lock()))
+
+            await self.run_feature_option(option, account, address, user, use_proxy)
+
+    async def run_feature_tasks(self, account: str, address: str, user: dict, use_proxy: bool):
+        enabled = {option for option, feature in self.FEATURE_TASKS.items() if getattr(self, feature["flag"])}
+
+        tasks, locks = {}, {}
+        for option in sorted(enabled):
+            tasks[option] = asyncio.create_task(
+                self.run_feature_task(option, tasks, locks, enabled, account, address, user, use_proxy)
+            )
+
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        for option, result in zip(tasks, results):
+            if isinstance(result, Exception):
+                self.log(
+                    f"{Fore.CYAN+Style.BRIGHT}{self.FEATURE_TASKS[option]['label']:<10}:{Style.RESET_ALL}"
+                    f"{Fore.RED+Style.BRIGHT} Error {Style.RESET_ALL}"
+                    f"{Fore.MAGENTA+Style.BRIGHT}-{Style.RESET_ALL}"
+                    f"{Fore.YELLOW+Style.BRIGHT} {str(result)} {Style.RESET_ALL}"
+                )
+
     async def process_accounts(self, account: str, address: str, option: int, use_proxy: bool, rotate_proxy: bool):
         signed = await self.process_user_signin(address, use_proxy, rotate_proxy)
         if signed:
 
             user = await self.user_data(address, use_proxy)
-            if not user: return
+            if not user: return False
             
             username = user.get("data", {}).get("profile", {}).get("username", "Unknown")
             sa_address = user.get("data", {}).get("profile", {}).get("smart_account_address", "Undifined")
@@ -2675,77 +3701,170 @@ class KiteAI:
                 f"{Fore.WHITE+Style.BRIGHT} {rank} {Style.RESET_ALL}"
             )
             
-            if option == 1:
-                await self.process_option_1(address, user, use_proxy)
+            if option == 12:
+                await self.run_feature_tasks(account, address, user, use_proxy)
+            else:
+                await self.run_feature_option(option, account, address, user, use_proxy)
 
-            elif option == 2:
-                await self.process_option_2(account, address, use_proxy)
+            return True
+
+        return False
 
-            elif option == 3:
-                await self.process_option_3(address, use_proxy)
+    def setup_account_headers(self, address: str):
+        user_agent = FakeUserAgent().random
+
+        self.FAUCET_HEADERS[address] = {
+            "Accept-Language": "application/json, text/plain, */*",
+            "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7",
+            "Origin": "https://faucet.gokite.ai",
+            "Referer": "https://faucet.gokite.ai/",
+            "Sec-Fetch-Dest": "empty",
+            "Sec-Fetch-Mode": "cors",
+            "Sec-Fetch-Site": "same-origin",
+            "User-Agent": user_agent
+        }
 
-            elif option == 4:
-                await self.process_option_4(address, use_proxy)
+        self.TESTNET_HEADERS[address] = {
+            "Accept-Language": "application/json, text/plain, */*",
+            "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7",
+            "Origin": "https://testnet.gokite.ai",
+            "Referer": "https://testnet.gokite.ai/",
+            "Sec-Fetch-Dest": "empty",
+            "Sec-Fetch-Mode": "cors",
+            "Sec-Fetch-Site": "same-site",
+            "User-Agent": user_agent
+        }
 
-            elif option == 5:
-                await self.process_option_5(address, use_proxy)
+        self.BRIDGE_HEADERS[address] = {
+            "Accept-Language": "application/json, text/plain, */*",
+            "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7",
+            "Origin": "https://bridge.prod.gokite.ai",
+            "Referer": "https://bridge.prod.gokite.ai/",
+            "Sec-Fetch-Dest": "empty",
+            "Sec-Fetch-Mode": "cors",
+            "Sec-Fetch-Site": "same-site",
+            "User-Agent": user_agent
+        }
 
-            elif option == 6:
-                await self.process_option_6(address, use_proxy)
+        self.MULTISIG_HEADERS[address] = {
+            "Accept-Language": "*/*",
+            "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7",
+            "Origin": "https://wallet.ash.center",
+            "Referer": "https://wallet.ash.center/",
+            "Sec-Fetch-Dest": "empty",
+            "Sec-Fetch-Mode": "cors",
+            "Sec-Fetch-Site": "same-site",
+            "User-Agent": user_agent
+        }
 
-            elif option == 7:
-                await self.process_option_7(address, use_proxy)
+    def clear_account_state(self, address: str):
+        for state in [
+            self.FAUCET_HEADERS, self.TESTNET_HEADERS, self.BRIDGE_HEADERS, self.MULTISIG_HEADERS,
+            self.auth_tokens, self.header_cookies, self.access_tokens, self.aa_address
+        ]:
+            state.pop(address, None)
+        self.invalidate_token_balances(address)
+        for key in [key for key in self.nonces if key[1] == address]:
+            self.nonces.pop(key, None)
 
-            elif option == 8:
-                await self.process_option_8(address, use_proxy)
+    async def run_account(self, account: str, option: int, use_proxy: bool, rotate_proxy: bool):
+        started = time.monotonic()
+        address = self.generate_address(account)
 
-            elif option == 9:
-                await self.process_option_9(account, address, use_proxy)
+        if self.account_workers > 1:
+            account_context.set(self.mask_account(address) if address else "Invalid Account")
 
-            elif option == 10:
-                await self.process_option_10(account, address, use_proxy)
+        separator = "=" * 25
+        self.log(
+            f"{Fore.CYAN + Style.BRIGHT}{separator}[{Style.RESET_ALL}"
+            f"{Fore.WHITE + Style.BRIGHT} {self.mask_account(address)} {Style.RESET_ALL}"
+            f"{Fore.CYAN + Style.BRIGHT}]{separator}{Style.RESET_ALL}"
+        )
 
-            elif option == 11:
-                await self.process_option_11(account, address, use_proxy)
+        if not address:
+            self.log(
+                f"{Fore.CYAN+Style.BRIGHT}Status    :{Style.RESET_ALL}"
+                f"{Fore.RED+Style.BRIGHT} Invalid Private Key or Libraries Version Not Supported {Style.RESET_ALL}"
+            )
+            self.close_captcha_claims(None)
+            return {"address": None, "status": "skipped", "elapsed": time.monotonic() - started}
+        
+        auth_token = self.generate_auth_token(address)
+        if not auth_token:
+            self.log(
+                f"{Fore.CYAN+Style.BRIGHT}Status    :{Style.RESET_ALL}"
+                f"{Fore.RED+Style.BRIGHT} Generate Auth Token Failed, Check Your Cryptography Library {Style.RESET_ALL}                  "
+            )
+            self.close_captcha_claims(None)
+            return {"address": address, "status": "skipped", "elapsed": time.monotonic() - started}
 
-            elif option == 12:
-                if self.auto_claim_faucet:
-                    await self.process_option_1(address, user, use_proxy)
+        self.setup_account_headers(address)
+        self.auth_tokens[address] = auth_token
+        self.open_captcha_claims(address)
 
-                if self.auto_deposit_token:
-                    await self.process_option_2(account, address, use_proxy)
+        try:
+            processed = await self.process_accounts(account, address, option, use_proxy, rotate_proxy)
+            status = "success" if processed else "failed"
+        except Exception as e:
+            self.log(f"{Fore.RED+Style.BRIGHT}Error: {e}{Style.RESET_ALL}")
+            status = "error"
+        finally:
+            self.close_captcha_claims(address)
+            await self.close_sessions(address)
+            self.clear_account_state(address)
 
-                if self.auto_withdraw_token:
-                    await self.process_option_3(address, use_proxy)
+        return {"address": address, "status": status, "elapsed": time.monotonic() - started}
 
-                if self.auto_unstake_token:
-                    await self.process_option_4(address, use_proxy)
+    async def account_worker(self, queue: asyncio.Queue, results: list, option: int, use_proxy: bool, rotate_proxy: bool):
+        while True:
+            try:
+                account = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
 
-                if self.auto_stake_token:
-                    await self.process_option_5(address, use_proxy)
+            results.append(await self.run_account(account, option, use_proxy, rotate_proxy))
 
-                if self.auto_claim_reward:
-                    await self.process_option_6(address, use_proxy)
+    async def run_all_accounts(self, accounts: list, option: int, use_proxy: bool, rotate_proxy: bool):
+        queue = asyncio.Queue()
+        for account in accounts:
+            queue.put_nowait(account)
 
-                if self.auto_daily_quiz:
-                    await self.process_option_7(address, use_proxy)
+        results = []
+        workers = max(1, min(self.account_workers, len(accounts)))
+        await asyncio.gather(*[
+            self.account_worker(queue, results, option, use_proxy, rotate_proxy) for _ in range(workers)
+        ])
 
-                if self.auto_chat_ai_agent:
-                    await self.process_option_8(address, use_proxy)
+        return results
 
-                if self.auto_create_multisig:
-                    await self.process_option_9(account, address, use_proxy)
+    def print_accounts_summary(self, results: list, elapsed: float):
+        counts = {status: 0 for status in ["success", "failed", "error", "skipped"]}
+        for result in results:
+            counts[result["status"]] += 1
 
-                if self.auto_swap_token:
-                    await self.process_option_10(account, address, use_proxy)
+        average = sum(result["elapsed"] for result in results) / len(results) if results else 0
 
-                if self.auto_bridge_token:
-                    await self.process_option_11(account, address, use_proxy)
+        self.log(
+            f"{Fore.CYAN+Style.BRIGHT}Summary   :{Style.RESET_ALL}"
+            f"{Fore.WHITE+Style.BRIGHT} {len(results)} Accounts {Style.RESET_ALL}"
+            f"{Fore.MAGENTA+Style.BRIGHT}-{Style.RESET_ALL}"
+            f"{Fore.GREEN+Style.BRIGHT} {counts['success']} Success {Style.RESET_ALL}"
+            f"{Fore.MAGENTA+Style.BRIGHT}-{Style.RESET_ALL}"
+            f"{Fore.RED+Style.BRIGHT} {counts['failed'] + counts['error']} Failed {Style.RESET_ALL}"
+            f"{Fore.MAGENTA+Style.BRIGHT}-{Style.RESET_ALL}"
+            f"{Fore.YELLOW+Style.BRIGHT} {counts['skipped']} Skipped {Style.RESET_ALL}"
+        )
+        self.log(
+            f"{Fore.CYAN+Style.BRIGHT}Elapsed   :{Style.RESET_ALL}"
+            f"{Fore.WHITE+Style.BRIGHT} {self.format_seconds(elapsed)} {Style.RESET_ALL}"
+            f"{Fore.MAGENTA+Style.BRIGHT}-{Style.RESET_ALL}"
+            f"{Fore.WHITE+Style.BRIGHT} Avg {self.format_seconds(average)} Per Account With {self.account_workers} Workers {Style.RESET_ALL}"
+        )
 
     async def main(self):
         try:
             with open('accounts.txt', 'r') as file:
-                accounts = [line.strip() for line in file if line.strip()]
+                accounts = list(dict.fromkeys(line.strip() for line in file if line.strip()))
 
             captcha_key = self.load_2captcha_key()
             if captcha_key:
@@ -2772,84 +3891,34 @@ class KiteAI:
 
                 if use_proxy:
                     await self.load_proxies()
+                    await self.start_proxy_pool()
+
+                if option == 13:
+                    addresses = [address for address in map(self.generate_address, accounts) if address]
+                    await self.scan_fleet_balances(addresses, use_proxy)
+                    self.print_fleet_balances(addresses)
+                    await self.close_sessions()
+                    self.token_balances.clear()
+                    return
+
+                if option in [2, 10, 11] or (option == 12 and (self.auto_deposit_token or self.auto_swap_token or self.auto_bridge_token)):
+                    await self.scan_fleet_balances([address for address in map(self.generate_address, accounts) if address], use_proxy)
                 
-                separator = "=" * 25
-                for account in accounts:
-                    if account:
-                        address = self.generate_address(account)
-                        self.log(
-                            f"{Fore.CYAN + Style.BRIGHT}{separator}[{Style.RESET_ALL}"
-                            f"{Fore.WHITE + Style.BRIGHT} {self.mask_account(address)} {Style.RESET_ALL}"
-                            f"{Fore.CYAN + Style.BRIGHT}]{separator}{Style.RESET_ALL}"
-                        )
-
-                        if not address:
-                            self.log(
-                                f"{Fore.CYAN+Style.BRIGHT}Status    :{Style.RESET_ALL}"
-                                f"{Fore.RED+Style.BRIGHT} Invalid Private Key or Libraries Version Not Supported {Style.RESET_ALL}"
-                            )
-                            continue
-                        
-                        auth_token = self.generate_auth_token(address)
-                        if not auth_token:
-                            self.log(
-                                f"{Fore.CYAN+Style.BRIGHT}Status    :{Style.RESET_ALL}"
-                                f"{Fore.RED+Style.BRIGHT} Generate Auth Token Failed, Check Your Cryptography Library {Style.RESET_ALL}                  "
-                            )
-                            continue
-
-                        user_agent = FakeUserAgent().random
-
-                        self.FAUCET_HEADERS[address] = {
-                            "Accept-Language": "application/json, text/plain, */*",
-                            "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7",
-                            "Origin": "https://faucet.gokite.ai",
-                            "Referer": "https://faucet.gokite.ai/",
-                            "Sec-Fetch-Dest": "empty",
-                            "Sec-Fetch-Mode": "cors",
-                            "Sec-Fetch-Site": "same-origin",
-                            "User-Agent": user_agent
-                        }
-
-                        self.TESTNET_HEADERS[address] = {
-                            "Accept-Language": "application/json, text/plain, */*",
-                            "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7",
-                            "Origin": "https://testnet.gokite.ai",
-                            "Referer": "https://testnet.gokite.ai/",
-                            "Sec-Fetch-Dest": "empty",
-                            "Sec-Fetch-Mode": "cors",
-                            "Sec-Fetch-Site": "same-site",
-                            "User-Agent": user_agent
-                        }
-
-                        self.BRIDGE_HEADERS[address] = {
-                            "Accept-Language": "application/json, text/plain, */*",
-                            "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7",
-                            "Origin": "https://bridge.prod.gokite.ai",
-                            "Referer": "https://bridge.prod.gokite.ai/",
-                            "Sec-Fetch-Dest": "empty",
-                            "Sec-Fetch-Mode": "cors",
-                            "Sec-Fetch-Site": "same-site",
-                            "User-Agent": user_agent
-                        }
+                if option == 1 or (option == 12 and self.auto_claim_faucet):
+                    self.start_captcha_prefetch(self.TESTNET_SITE_KEY, self.TESTNET_API, len(accounts), 1)
+                    self.start_captcha_prefetch(self.FAUCET_SITE_KEY, self.FAUCET_API, len(accounts), 2)
+                
+                started = time.monotonic()
+                results = await self.run_all_accounts(accounts, option, use_proxy, rotate_proxy)
 
-                        self.MULTISIG_HEADERS[address] = {
-                            "Accept-Language": "*/*",
-                            "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7",
-                            "Origin": "https://wallet.ash.center",
-                            "Referer": "https://wallet.ash.center/",
-                            "Sec-Fetch-Dest": "empty",
-                            "Sec-Fetch-Mode": "cors",
-                            "Sec-Fetch-Site": "same-site",
-                            "User-Agent": user_agent
-                        }
-                        
-                        self.auth_tokens[address] = auth_token
-                        
-                        await self.process_accounts(account, address, option, use_proxy, rotate_proxy)
-                        await asyncio.sleep(3)
+                await self.stop_captcha_prefetch()
+                await self.close_sessions()
+                self.token_balances.clear()
 
                 self.log(f"{Fore.CYAN + Style.BRIGHT}={Style.RESET_ALL}"*72)
+                self.print_accounts_summary(results, time.monotonic() - started)
+                self.print_request_stats()
+                
                 seconds = 24 * 60 * 60
                 while seconds > 0:
                     formatted_time = self.format_seconds(seconds)
@@ -257,7 +257,7 @@ class KiteAICron:
                 "gas": int(gas * 1.2),
                 "maxFeePerGas": max_priority_fee,
                 "maxPriorityFeePerGas": max_priority_fee,
-                "nonce": web3.eth.get_transaction_count(address),
+                "nonce": web3.eth.get_transaction_count(address, "pending"),
                 "chainId": web3.eth.chain_id,
             })
 